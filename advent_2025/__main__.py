@@ -0,0 +1,5 @@
+import sys
+
+from advent_2025.runner import main
+
+sys.exit(main())
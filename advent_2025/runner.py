@@ -0,0 +1,189 @@
+"""
+Run every day's solver, with the days (and their test and real inputs) in parallel.
+
+Each (day, input) pair is one task in a process pool: it loads and parses the input
+once and then solves both parts from it, timing the load and each part. Inputs
+that are not in data/raw are skipped. Run from the project root:
+
+    python -m advent_2025
+    python -m advent_2025 --days 4 5 --inputs real --json timings.json
+"""
+
+import argparse
+from dataclasses import asdict, dataclass
+import json
+import os
+from pathlib import Path
+import sys
+import time
+from typing import Any, Callable, Optional
+
+from pebble import ProcessPool
+
+from advent_2025.solutions import day1, day2, day3, day4, day5
+from advent_2025.utils.data import raw_path
+
+INPUTS = ("test", "real")
+
+
+@dataclass
+class DaySolver:
+    """How to load one day's input and solve each part from the loaded input."""
+
+    load: Callable[[bool], Any]
+    parts: dict[int, Callable[[Any], int]]
+
+
+def load_day_five(test: bool) -> tuple:
+    """Load the Day 5 range index; part one streams the ingredients from the raw file."""
+    return day5.get_data_path(test), day5.load_range_index(test)
+
+
+SOLVERS = {
+    1: DaySolver(
+        load=day1.load_moves,
+        parts={
+            part: lambda moves, part=part: day1.calculate_solution_vectorised(
+                moves, day1.STARTING_VALUE, part
+            )
+            for part in (1, 2)
+        },
+    ),
+    2: DaySolver(
+        load=day2.load_data,
+        parts={
+            part: lambda codes, part=part: day2.count_and_sum_invalid_ids_in_ranges(codes, part)[1]
+            for part in (1, 2)
+        },
+    ),
+    3: DaySolver(
+        load=day3.load_bank_index,
+        parts={1: lambda index: index.total(2), 2: lambda index: index.total(12)},
+    ),
+    4: DaySolver(
+        load=day4.load_array,
+        parts={
+            1: lambda grid: day4.remove_accessible_rolls(grid.astype(bool), threshold=4),
+            2: lambda grid: day4.count_removable_rolls(grid, threshold=4),
+        },
+    ),
+    5: DaySolver(
+        load=load_day_five,
+        parts={
+            1: lambda loaded: day5.count_fresh_indexed(*loaded),
+            2: lambda loaded: day5.count_range_index(loaded[1]),
+        },
+    ),
+}
+
+
+@dataclass
+class JobResult:
+    day: int
+    part: int
+    input: str
+    answer: Optional[int]
+    load_seconds: float
+    solve_seconds: float
+    error: Optional[str] = None
+
+
+def plan_jobs(days: list[int], inputs: list[str]) -> tuple[list[tuple[int, str]], list[Path]]:
+    """Return the (day, input) pairs to run and the paths of the inputs that are missing."""
+    planned = []
+    missing = []
+    for day in days:
+        for name in inputs:
+            path = raw_path(day, test=name == "test")
+            if path.exists():
+                planned.append((day, name))
+            else:
+                missing.append(path)
+    return planned, missing
+
+
+def run_day_input(day: int, name: str) -> list[JobResult]:
+    """Load one input for a day and solve every part from it."""
+    solver = SOLVERS[day]
+    start = time.perf_counter()
+    loaded = solver.load(name == "test")
+    load_seconds = time.perf_counter() - start
+
+    results = []
+    for part, solve in solver.parts.items():
+        start = time.perf_counter()
+        try:
+            answer, error = int(solve(loaded)), None
+        except Exception as e:
+            answer, error = None, f"{type(e).__name__}: {e}"
+        results.append(
+            JobResult(day, part, name, answer, load_seconds, time.perf_counter() - start, error)
+        )
+    return results
+
+
+def run_jobs(
+    jobs: list[tuple[int, str]], max_workers: Optional[int] = None, timeout: Optional[float] = None
+) -> list[JobResult]:
+    """Run the (day, input) jobs in a process pool; one that fails becomes error results."""
+    results = []
+    with ProcessPool(max_workers=max_workers or min(len(jobs), os.cpu_count() or 1)) as pool:
+        futures = [pool.schedule(run_day_input, args=job, timeout=timeout) for job in jobs]
+        for (day, name), future in zip(jobs, futures):
+            try:
+                results.extend(future.result())
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                results.extend(
+                    JobResult(day, part, name, None, 0.0, 0.0, error)
+                    for part in SOLVERS[day].parts
+                )
+    return results
+
+
+def format_report(results: list[JobResult], wall_seconds: float) -> str:
+    """Render the results as a plain-text table followed by the overall timings."""
+    lines = [f"{'day':>3} {'part':>4} {'input':<5} {'answer':>20} {'load s':>8} {'solve s':>8}"]
+    for r in sorted(results, key=lambda r: (r.day, INPUTS.index(r.input), r.part)):
+        answer = r.error if r.error else r.answer
+        lines.append(
+            f"{r.day:>3} {r.part:>4} {r.input:<5} {answer:>20} "
+            f"{r.load_seconds:>8.4f} {r.solve_seconds:>8.4f}"
+        )
+
+    # Each input's load time is shared by its parts, so count it once per input
+    loads = {(r.day, r.input): r.load_seconds for r in results}
+    total = sum(loads.values()) + sum(r.solve_seconds for r in results)
+    lines.append(f"Wall clock: {wall_seconds:.4f}s, total job time: {total:.4f}s")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--days", type=int, nargs="+", default=sorted(SOLVERS))
+    parser.add_argument("--inputs", nargs="+", choices=INPUTS, default=list(INPUTS))
+    parser.add_argument("--workers", type=int, help="Processes to use (default: one per job).")
+    parser.add_argument("--timeout", type=float, help="Seconds before a job is cancelled.")
+    parser.add_argument("--json", type=Path, help="Also write the results here.")
+    args = parser.parse_args(argv)
+
+    jobs, missing = plan_jobs(args.days, args.inputs)
+    for path in missing:
+        print(f"Skipping missing input {path}")
+    if not jobs:
+        return 0
+
+    start = time.perf_counter()
+    results = run_jobs(jobs, args.workers, args.timeout)
+    wall_seconds = time.perf_counter() - start
+
+    print(format_report(results, wall_seconds))
+    if args.json:
+        records = [asdict(r) for r in results]
+        args.json.write_text(json.dumps({"wall_seconds": wall_seconds, "jobs": records}, indent=2))
+
+    return 1 if any(r.error for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,29 +1,42 @@
 # Day 1
 
+from dataclasses import asdict, dataclass
+import json
 import sys
 from pathlib import Path
-import pandas as pd
 from loguru import logger
-from typing import List
+import numpy as np
+from typing import Iterator, List, Optional, Union
+
+from advent_2025.utils.data import load_cached, raw_path
+from advent_2025.utils.instrumentation import count, stage
 
 MODULE_ROOT = Path(__file__).resolve().parent.parent
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
-RAW_DATA_DIR = PROJECT_ROOT / "data" / "raw"
 
 STARTING_VALUE = 50
 
+# Bytes read at a time by the streaming solver
+STREAM_BLOCK_SIZE = 1 << 20
+
+# Longest digit run that still fits in an int64
+MAX_CODE_DIGITS = 18
+POWERS_OF_TEN = 10 ** np.arange(MAX_CODE_DIGITS, dtype=np.int64)
+
 LOGGING_LEVEL = "INFO"
 
 # Update the project path to reference other files 
 sys.path.append(PROJECT_ROOT)
 
 
+def get_data_path(test=False, raw_dir: Optional[Path] = None):
+    """Return the path of the Day 1 input file, in data/raw unless `raw_dir` is given."""
+    return raw_path(1, test, raw_dir)
+
+
 def read_data(test=False):
     """Read Data from Day 1 file into a list."""
-    if test:
-        file_path = RAW_DATA_DIR / 'test_day_1.txt'
-    else:
-        file_path = RAW_DATA_DIR / 'day_1.txt'
+    file_path = get_data_path(test)
     return [line.strip() for line in file_path.read_text().splitlines()]
 
 
@@ -63,12 +76,82 @@ def convert_directions(values: List[str]) -> List[int]:
 
     return output
 
+
+def _convert_directions_slow(data: bytes) -> np.ndarray:
+    """Parse rotation log bytes line by line with `convert_directions`."""
+    return np.asarray(convert_directions(data.decode().splitlines()), dtype=np.int64)
+
+
+def parse_directions_bytes(data: bytes) -> np.ndarray:
+    """
+    Parse raw rotation log bytes into an array of signed moves.
+
+    This gives the same result as `convert_directions` on the file's lines, but
+    finds the line breaks, prefixes and digit runs with NumPy operations on a
+    zero-copy view of the bytes. Input the fast path cannot take (other whitespace,
+    bad prefixes or digits, empty lines, codes of more than 18 digits) is handed to
+    `convert_directions`, so errors are raised with the same messages.
+
+    Args:
+        data (bytes): Contents of a rotation log.
+
+    Returns:
+        np.ndarray: An int64 array of signed moves.
+
+    Raises:
+        ValueError: If a line is empty or is not 'R' or 'L' followed by digits.
+    """
+    if not data:
+        return np.zeros(0, dtype=np.int64)
+
+    raw = np.frombuffer(data, dtype=np.uint8)
+    # A trailing newline does not start a new (empty) line
+    if raw[-1] == ord("\n"):
+        raw = raw[:-1]
+
+    newlines = np.flatnonzero(raw == ord("\n"))
+    starts = np.concatenate(([0], newlines + 1))
+    n_digits = np.concatenate((newlines, [raw.size])) - starts - 1
+    if raw.size == 0 or n_digits.min() < 1 or n_digits.max() > MAX_CODE_DIGITS:
+        return _convert_directions_slow(data)
+
+    prefixes = raw[starts]
+    is_digit = (raw >= ord("0")) & (raw <= ord("9"))
+    well_formed = np.all((prefixes == ord("R")) | (prefixes == ord("L"))) and (
+        np.count_nonzero(is_digit) == raw.size - newlines.size - starts.size
+    )
+    if not well_formed:
+        return _convert_directions_slow(data)
+
+    digits = raw[is_digit].astype(np.int64) - ord("0")
+    line_ends = np.cumsum(n_digits)
+    exponents = np.repeat(line_ends, n_digits) - 1 - np.arange(digits.size)
+    moves = np.add.reduceat(digits * POWERS_OF_TEN[exponents], line_ends - n_digits)
+    moves[prefixes == ord("L")] *= -1
+
+    return moves
+
+
 def load_data(test=False):
     """Load and clean data for Day 1"""
     input_codes = read_data(test)
     clean_codes = convert_directions(input_codes)
     return clean_codes
 
+
+def load_moves(test=False, raw_dir: Optional[Path] = None) -> np.ndarray:
+    """
+    Load the Day 1 moves as an int64 array, parsed from the file bytes on the first
+    run and memory-mapped from the parsed-input cache after that.
+
+    Hashing the file and mapping the cached moves are timed as "day1.read", and
+    parsing on a cache miss as "day1.parse".
+    """
+    path = get_data_path(test, raw_dir)
+    return load_cached(
+        path, "moves", lambda p: parse_directions_bytes(p.read_bytes()), stage_prefix="day1"
+    )[0]
+
 def simplify_input_code(code):
     """Take a long input code and return the number of full and partial 
     rotations"""
@@ -87,9 +170,9 @@ def calculate_solution(codes, starting_value, problem_part):
     according to the codes. Should an intermediate value land on zero,
     increment the count. Return the total number of zeroes at the end."""
     
-    logger.debug("Starting solution calculation.")
     current_value = starting_value
     n_zeroes = 0
+    total_full_turns = 0
     
     if problem_part==1:
         for code in codes:
@@ -100,40 +183,198 @@ def calculate_solution(codes, starting_value, problem_part):
         for code in codes:
 
             # Count the number of full turns required
-            logger.debug("Code Value: {}".format(code))
             new_code, full_turns = simplify_input_code(code)
-            logger.debug("New input code: {}".format(new_code))
             n_zeroes += full_turns
-            logger.debug("Number of Full Turns: {}".format(full_turns))
-
-            if full_turns > 0:
-                logger.debug("Increasing Count. New Count: {}".format(n_zeroes))
-
-            logger.debug("Current Value: {}".format(current_value))
-            logger.debug("Dial Value: {}".format(new_code))
-            logger.debug("Sum: {}".format(new_code+current_value))
+            total_full_turns += full_turns
             
             if current_value == 0:
                 pass
             elif (current_value + new_code >= 100) | (current_value + new_code <= 0):
                 n_zeroes += 1
-                logger.debug("Increasing Count. New Count: {}".format(n_zeroes))
             current_value = turn_dial(current_value, new_code)
-            logger.debug("New current value: {}".format(current_value))
+
+    # Aggregated once per call rather than logged once per code
+    count("day1.codes_processed", len(codes))
+    count("day1.full_turns", total_full_turns)
+    logger.debug("Processed {} codes: {} full turns, {} zeroes, final value {}.".format(
+        len(codes), total_full_turns, n_zeroes, current_value))
+    return n_zeroes
+
+def count_zeroes(moves: np.ndarray, starting_value: int, problem_part: int) -> tuple[int, int]:
+    """
+    Count the zeroes for a block of moves without stepping through them in Python.
+
+    As in `calculate_solution`, each move is split into its full turns and a
+    remainder under 100. The dial positions are the prefix sums of the remainders,
+    reduced mod 100, so they stay small however large the moves are. Part one
+    counts the positions landing on zero. Part two adds the full turns to the
+    remainders that pass or land on zero from a non-zero position.
+
+    Args:
+        moves (np.ndarray): Signed moves, as returned by `convert_directions`.
+        starting_value (int): Dial position before the first move.
+        problem_part (int): 1 or 2.
+
+    Returns:
+        tuple[int, int]: The number of zeroes and the final dial position.
+    """
+    moves = np.asarray(moves, dtype=np.int64)
+    distances = np.abs(moves)
+    remainders = np.where(moves < 0, -(distances % 100), distances % 100)
+
+    positions = np.empty(moves.size + 1, dtype=np.int64)
+    positions[0] = starting_value % 100
+    np.cumsum(remainders, out=positions[1:])
+    positions[1:] += positions[0]
+    positions %= 100
+
+    if problem_part == 1:
+        n_zeroes = int(np.count_nonzero(positions[1:] == 0))
+    elif problem_part == 2:
+        previous = positions[:-1]
+        passed = (previous != 0) & ((previous + remainders >= 100) | (previous + remainders <= 0))
+        n_zeroes = int(np.count_nonzero(passed)) + sum_full_turns(distances // 100)
+    else:
+        raise ValueError(f"Invalid problem part '{problem_part}'. Expected 1 or 2.")
+
+    return n_zeroes, int(positions[-1])
+
+
+def sum_full_turns(full_turns: np.ndarray) -> int:
+    """Sum the full turns, in Python integers if the int64 sum could overflow."""
+    if full_turns.size == 0:
+        return 0
+    if int(full_turns.max()) <= np.iinfo(np.int64).max // full_turns.size:
+        return int(full_turns.sum())
+    return sum(full_turns.tolist())
+
+
+def calculate_solution_vectorised(codes, starting_value, problem_part):
+    """NumPy equivalent of `calculate_solution`, returning the number of zeroes."""
+    n_zeroes, _ = count_zeroes(codes, starting_value, problem_part)
     return n_zeroes
 
-def day_one(problem_part, test=False):
+
+@dataclass
+class DialCheckpoint:
+    """State of a streamed rotation log after `offset` bytes have been processed."""
+
+    problem_part: int
+    position: int = STARTING_VALUE
+    n_zeroes: int = 0
+    offset: int = 0
+
+
+def save_checkpoint(checkpoint: DialCheckpoint, path: Union[str, Path]) -> None:
+    """Write a checkpoint to a JSON file."""
+    Path(path).write_text(json.dumps(asdict(checkpoint)))
+
+
+def load_checkpoint(path: Union[str, Path]) -> DialCheckpoint:
+    """Read a checkpoint written by `save_checkpoint`."""
+    return DialCheckpoint(**json.loads(Path(path).read_text()))
+
+
+def iter_direction_blocks(
+    file_path: Union[str, Path],
+    offset: int = 0,
+    block_size: int = STREAM_BLOCK_SIZE,
+    final: bool = False,
+) -> Iterator[tuple[np.ndarray, int]]:
+    """
+    Read a rotation log in blocks and yield the parsed moves of each block.
+
+    Each block is cut at its last newline so that a code is never split between
+    blocks; the left-over bytes are carried into the next read. A final line
+    without a trailing newline may still be being written, so it is only parsed
+    when `final` is True.
+
+    Yields:
+        tuple[np.ndarray, int]: The signed moves, and the byte offset just after the
+        last line they were parsed from.
+    """
+    with open(file_path, "rb") as f:
+        f.seek(offset)
+        remainder = b""
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+
+            block = remainder + block
+            cut = block.rfind(b"\n") + 1
+            lines, remainder = block[:cut], block[cut:]
+            if lines:
+                offset += len(lines)
+                yield parse_directions_bytes(lines), offset
+
+        if remainder and final:
+            offset += len(remainder)
+            yield parse_directions_bytes(remainder), offset
+
+
+def solve_stream(
+    file_path: Union[str, Path],
+    problem_part: int,
+    checkpoint: Optional[DialCheckpoint] = None,
+    block_size: int = STREAM_BLOCK_SIZE,
+    final: bool = False,
+) -> DialCheckpoint:
+    """
+    Solve a rotation log block by block, keeping memory use independent of its size.
+
+    Passing the checkpoint returned by a previous call resumes from where that call
+    stopped, so only lines appended to the log since then are read. By default the
+    checkpoint covers newline-terminated lines only, since a last line without a
+    newline may be half-written; pass `final=True` once the log is complete to
+    include it.
+
+    Args:
+        file_path (Union[str, Path]): Path to the rotation log.
+        problem_part (int): 1 or 2.
+        checkpoint (Optional[DialCheckpoint]): State to resume from.
+        block_size (int): Number of bytes read at a time.
+        final (bool): Also count an unterminated last line, and move the offset past it.
+
+    Returns:
+        DialCheckpoint: The dial state at the end of the file.
+
+    Raises:
+        ValueError: If the checkpoint was saved for the other problem part.
+    """
+    if checkpoint is None:
+        checkpoint = DialCheckpoint(problem_part=problem_part)
+    elif checkpoint.problem_part != problem_part:
+        raise ValueError(
+            f"Checkpoint is for part {checkpoint.problem_part}, not part {problem_part}."
+        )
+
+    position = checkpoint.position
+    n_zeroes = checkpoint.n_zeroes
+    offset = checkpoint.offset
+
+    blocks = iter_direction_blocks(file_path, checkpoint.offset, block_size, final)
+    for moves, offset in blocks:
+        block_zeroes, position = count_zeroes(moves, position, problem_part)
+        n_zeroes += block_zeroes
+        count("day1.lines_parsed", moves.size)
+        count("day1.blocks_read")
+
+    return DialCheckpoint(problem_part, position, n_zeroes, offset)
+
+
+def day_one(problem_part, test=False, raw_dir=None):
     
     # Load Data
-    logger.debug("Loading input data.")
-    codes = load_data(test)
-    input_length = len(codes)
-    logger.debug("Code Length: {}".format(input_length))
+    codes = load_moves(test, raw_dir)
+    count("day1.lines_parsed", len(codes))
+    logger.debug("Code Length: {}".format(len(codes)))
 
     # Calculate Solution
-    solution = calculate_solution(problem_part=problem_part, 
-                                  codes=codes,
-                                  starting_value = STARTING_VALUE)
+    with stage("day1.solve"):
+        solution = calculate_solution_vectorised(problem_part=problem_part,
+                                                 codes=codes,
+                                                 starting_value=STARTING_VALUE)
 
     # Return Answer
     return solution
@@ -1,31 +1,57 @@
+from __future__ import annotations
+
+from collections import deque
+from functools import lru_cache
+import heapq
+import os
 import sys
 from pathlib import Path
-import pandas as pd
 from loguru import logger
-from typing import List
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional
+
+from advent_2025.utils.data import raw_path
+from advent_2025.utils.instrumentation import count, stage
+
+# NumPy and Pebble are only needed by the vectorised and parallel paths, so they
+# are imported inside those functions to keep the closed-form solver quick to load
+if TYPE_CHECKING:
+    import numpy as np
 
 MODULE_ROOT = Path(__file__).resolve().parent.parent
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
-RAW_DATA_DIR = PROJECT_ROOT / "data" / "raw"
 
 LOGGING_LEVEL = "INFO"
 
+# Number of IDs each worker checks at a time in the brute-force parallel mode
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+# Chunks queued per worker at any one time in the parallel mode
+IN_FLIGHT_PER_WORKER = 2
+
+# Number of IDs checked per NumPy call in get_invalid_ids_in_list
+BLOCK_SIZE = 1_000_000
+
 
 def load_data(test=False):
     """Load data for day 2. Defaults for actuals but test data can be
     specified."""
-    if test:
-        path = PROJECT_ROOT / "data/raw/test_day_2.txt"
-    else:
-        path = PROJECT_ROOT / "data/raw/day_2.txt"
+    return parse_codes(read_data(test))
+
+
+def read_data(test=False, raw_dir: Optional[Path] = None) -> str:
+    """Read the raw text of the day 2 input, from data/raw unless `raw_dir` is given."""
+    path = raw_path(2, test, raw_dir)
 
     with open(path, "r", encoding="utf-8") as f:
-        content = f.read()
+        return f.read()
 
+
+def parse_codes(content: str) -> list[str]:
+    """Split the raw input into its comma-separated "start-end" ranges."""
     return [item.strip() for item in content.split(",")]
 
 
-def get_start_end_id(code: str) -> tuple(int, int):
+def get_start_end_id(code: str) -> tuple[int, int]:
     """Split a text range into a start and end integer"""
     start, end = code.split("-")
     return int(start), int(end)
@@ -79,12 +105,83 @@ def is_invalid_id(id_value: int, problem_part: int) -> bool:
     return False
 
 
+@lru_cache(maxsize=None)
+def get_powers_of_ten() -> np.ndarray:
+    """Return 10**0 ... 10**19 as uint64; every non-negative int64 has at most 19 digits."""
+    import numpy as np
+
+    return 10 ** np.arange(20, dtype=np.uint64)
+
+
+def get_digit_lengths(ids: np.ndarray) -> np.ndarray:
+    """Return the number of decimal digits of each non-negative integer in `ids`."""
+    import numpy as np
+
+    powers_of_ten = get_powers_of_ten()
+    values = ids.astype(np.uint64)
+    lengths = np.floor(np.log10(np.maximum(ids, 1))).astype(np.int64) + 1
+    # log10 in floating point can land on the wrong side of a power of ten, so
+    # correct the estimate against the exact powers
+    lengths += values >= powers_of_ten[lengths]
+    lengths -= np.maximum(values, 1) < powers_of_ten[lengths - 1]
+    return lengths
+
+
+def is_invalid_id_array(ids: np.ndarray, problem_part: int) -> np.ndarray:
+    """
+    Vectorised version of `is_invalid_id` for an array of integer IDs.
+
+    An ID of L digits repeats with a period of p digits exactly when it equals its
+    last p digits times the repeat multiplier (e.g. 123123 == 123 * 1001), so each
+    (length, period) pair is checked with a modulo and a multiply over the whole
+    array. Arithmetic is done in uint64 so the products cannot overflow.
+
+    Args:
+        ids (np.ndarray): Non-negative integer IDs (anything castable to int64).
+        problem_part (int): 1 for exact doubling, 2 for any repeat period.
+
+    Returns:
+        np.ndarray: Boolean mask, True where the ID is invalid.
+
+    Raises:
+        ValueError: If any ID is negative.
+    """
+    import numpy as np
+
+    ids = np.asarray(ids, dtype=np.int64)
+    if ids.size and ids.min() < 0:
+        raise ValueError("IDs must be non-negative.")
+
+    mask = np.zeros(ids.shape, dtype=bool)
+    if not ids.size:
+        return mask
+
+    values = ids.astype(np.uint64)
+    lengths = get_digit_lengths(ids)
+
+    for length in np.unique(lengths).tolist():
+        periods = get_repeat_periods(length, problem_part)
+        if not periods:
+            continue
+        selected = lengths == length
+        subset = values[selected]
+        hits = np.zeros(subset.shape, dtype=bool)
+        for period in periods:
+            multiplier = np.uint64(get_repeat_multiplier(length, period))
+            hits |= (subset % get_powers_of_ten()[period]) * multiplier == subset
+        mask[selected] = hits
+
+    return mask
+
+
 def get_invalid_ids_in_list(problem_part, nums: list[int]) -> list[int]:
     """From a list of integers, evaluate IDs and return a list of invalid IDs"""
+    import numpy as np
+
     invalid_values = []
-    for num in nums:
-        if is_invalid_id(num, problem_part):
-            invalid_values.append(num)
+    for block_start in range(0, len(nums), BLOCK_SIZE):
+        block = np.asarray(nums[block_start : block_start + BLOCK_SIZE], dtype=np.int64)
+        invalid_values.extend(block[is_invalid_id_array(block, problem_part)].tolist())
 
     if not invalid_values:
         invalid_values.append(0)
@@ -92,12 +189,257 @@ def get_invalid_ids_in_list(problem_part, nums: list[int]) -> list[int]:
     return invalid_values
 
 
-def solve_day_two(problem_part, test=False):
-    """Overall solver for day two."""
-    data = load_data(test)
-    all_ids = get_full_candidate_list(data)
-    invalid_ids = get_invalid_ids_in_list(problem_part=problem_part, nums=all_ids)
-    out = sum(invalid_ids)
+def get_repeat_periods(length: int, problem_part: int) -> list[int]:
+    """
+    Return the unit lengths that generate every invalid ID of a given digit length.
+
+    For part one only the exact half of an even length qualifies. For part two any
+    proper divisor would do, but every repeated number also repeats with a period of
+    length // q for some prime q dividing the length, so only those maximal periods
+    are returned.
+    """
+    if problem_part == 1:
+        return [length // 2] if length % 2 == 0 else []
+
+    periods = []
+    remaining = length
+    factor = 2
+    while factor * factor <= remaining:
+        if remaining % factor == 0:
+            periods.append(length // factor)
+            while remaining % factor == 0:
+                remaining //= factor
+        factor += 1
+    if remaining > 1:
+        periods.append(length // remaining)
+    return sorted(p for p in periods if p < length)
+
+
+def get_repeat_multiplier(length: int, period: int) -> int:
+    """
+    Multiplier that repeats a unit of `period` digits up to `length` digits.
+
+    For example a period of 2 over 6 digits gives 10101, and 12 * 10101 = 121212.
+    """
+    return (10**length - 1) // (10**period - 1)
+
+
+def get_unit_bounds(start: int, end: int, length: int, period: int) -> tuple[int, int]:
+    """
+    Return the inclusive range of units whose repeats of `length` digits fall in [start, end].
+
+    The bounds may be empty (lower > upper) when no repeat lands in the range.
+    """
+    multiplier = get_repeat_multiplier(length, period)
+    lower = max(10 ** (period - 1), -(-start // multiplier))
+    upper = min(10**period - 1, end // multiplier)
+    return lower, upper
+
+
+def iter_invalid_ids(start: int, end: int, problem_part: int) -> Iterator[int]:
+    """
+    Yield every invalid ID in [start, end] in ascending order.
+
+    Rather than testing each number in the range, the invalid IDs of each digit
+    length are built directly from their repeated unit ("XX", "XYXY", "XYZXYZ"...).
+    In part two a number can repeat with several periods (e.g. 222222 repeats "2",
+    "22" and "222"), so the sequences for each period are merged and duplicates
+    dropped. The work done is proportional to the number of IDs yielded.
+    """
+    for length in range(len(str(max(start, 1))), len(str(max(end, 1))) + 1):
+        sequences = []
+        for period in get_repeat_periods(length, problem_part):
+            multiplier = get_repeat_multiplier(length, period)
+            lower, upper = get_unit_bounds(start, end, length, period)
+            sequences.append(range(lower * multiplier, upper * multiplier + 1, multiplier))
+
+        previous = None
+        for id_value in heapq.merge(*sequences):
+            if id_value != previous:
+                yield id_value
+                previous = id_value
+
+
+def get_mobius(n: int) -> int:
+    """Return the Möbius function of n (0 if n has a squared prime factor)."""
+    result = 1
+    factor = 2
+    while factor * factor <= n:
+        if n % factor == 0:
+            n //= factor
+            if n % factor == 0:
+                return 0
+            result = -result
+        factor += 1
+    if n > 1:
+        result = -result
+    return result
+
+
+def count_and_sum_repeats(start: int, end: int, length: int, period: int) -> tuple[int, int]:
+    """
+    Count and sum the numbers of `length` digits in [start, end] that repeat with `period`.
+
+    These are unit * multiplier for a contiguous block of units, so the sum is the
+    arithmetic series of the units scaled by the multiplier.
+    """
+    lower, upper = get_unit_bounds(start, end, length, period)
+    if lower > upper:
+        return 0, 0
+    n = upper - lower + 1
+    return n, get_repeat_multiplier(length, period) * (lower + upper) * n // 2
+
+
+def count_and_sum_invalid_ids(start: int, end: int, problem_part: int) -> tuple[int, int]:
+    """
+    Return the number and the sum of the invalid IDs in [start, end] without listing them.
+
+    In part one each even length contributes the single half-length period. In part
+    two the numbers repeating with period d (for each proper divisor d of the length)
+    overlap wherever periods share a common divisor, so each period is weighted by
+    -mu(length / d) to count every invalid ID exactly once.
+    """
+    total_count = 0
+    total_sum = 0
+    for length in range(len(str(max(start, 1))), len(str(max(end, 1))) + 1):
+        if problem_part == 1:
+            weighted_periods = [(p, 1) for p in get_repeat_periods(length, problem_part)]
+        else:
+            weighted_periods = [
+                (d, -get_mobius(length // d)) for d in range(1, length) if length % d == 0
+            ]
+
+        for period, weight in weighted_periods:
+            if weight == 0:
+                continue
+            n, total = count_and_sum_repeats(start, end, length, period)
+            total_count += weight * n
+            total_sum += weight * total
+
+    return total_count, total_sum
+
+
+def count_and_sum_invalid_ids_in_ranges(codes: list[str], problem_part: int) -> tuple[int, int]:
+    """Return the combined count and sum of invalid IDs over a list of text ranges."""
+    total_count = 0
+    total_sum = 0
+    for code in codes:
+        start, end = get_start_end_id(code)
+        n, total = count_and_sum_invalid_ids(start, end, problem_part)
+        total_count += n
+        total_sum += total
+    return total_count, total_sum
+
+
+def iter_invalid_ids_in_ranges(codes: list[str], problem_part: int) -> Iterator[int]:
+    """Yield the invalid IDs for each text range in turn."""
+    for code in codes:
+        start, end = get_start_end_id(code)
+        yield from iter_invalid_ids(start, end, problem_part)
+
+
+def iter_range_chunks(codes: list[str], chunk_size: int) -> Iterator[tuple[int, int]]:
+    """Split each text range into inclusive (start, end) chunks of at most chunk_size IDs."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+
+    for code in codes:
+        start, end = get_start_end_id(code)
+        for chunk_start in range(start, end + 1, chunk_size):
+            yield chunk_start, min(chunk_start + chunk_size - 1, end)
+
+
+def count_and_sum_invalid_ids_in_chunk(
+    start: int, end: int, problem_part: int, predicate: Callable[[int, int], bool] = is_invalid_id
+) -> tuple[int, int]:
+    """Check every ID in [start, end] with `predicate`, returning the count and sum of invalid IDs."""
+    n = 0
+    total = 0
+    for num in range(start, end + 1):
+        if predicate(num, problem_part):
+            n += 1
+            total += num
+    return n, total
+
+
+def solve_ranges_in_parallel(
+    codes: list[str],
+    problem_part: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: int | None = None,
+    timeout: float | None = None,
+    predicate: Callable[[int, int], bool] = is_invalid_id,
+) -> int:
+    """
+    Brute-force the sum of invalid IDs by checking each ID across a process pool.
+
+    Each range is split into chunks of `chunk_size` IDs and every chunk is checked
+    by a worker, so only the chunk bounds and the partial sums ever leave a worker.
+    This is much slower than the closed-form path but works with any predicate,
+    which must be a module-level function so it can be sent to the workers.
+
+    Args:
+        codes (list[str]): Text ranges of the form "a-b".
+        problem_part (int): Puzzle part passed through to the predicate.
+        chunk_size (int): Number of IDs checked per task.
+        max_workers (int | None): Pool size. Defaults to the number of CPUs.
+        timeout (float | None): Seconds allowed per chunk before it is cancelled.
+        predicate (Callable[[int, int], bool]): Returns True for an invalid ID.
+
+    Returns:
+        int: The sum of the invalid IDs.
+
+    Raises:
+        TimeoutError: If a chunk takes longer than `timeout`.
+    """
+    from pebble import ProcessPool
+
+    n_workers = max_workers or os.cpu_count() or 1
+
+    # Chunks are scheduled lazily, with at most IN_FLIGHT_PER_WORKER per worker
+    # queued at once, so memory use does not grow with the width of the ranges
+    total = 0
+    in_flight = deque()
+    with ProcessPool(max_workers=n_workers) as pool:
+        for chunk in iter_range_chunks(codes, chunk_size):
+            if len(in_flight) >= IN_FLIGHT_PER_WORKER * n_workers:
+                total += in_flight.popleft().result()[1]
+            in_flight.append(
+                pool.schedule(
+                    count_and_sum_invalid_ids_in_chunk,
+                    args=(*chunk, problem_part, predicate),
+                    timeout=timeout,
+                )
+            )
+        while in_flight:
+            total += in_flight.popleft().result()[1]
+
+    return total
+
+
+def solve_day_two(problem_part, test=False, method="closed_form", raw_dir=None, **kwargs):
+    """
+    Overall solver for day two.
+
+    `method` is either "closed_form" (the default) or "parallel", which brute-forces
+    every ID over a process pool; extra keyword arguments are passed to
+    `solve_ranges_in_parallel`.
+    """
+    if method not in ("closed_form", "parallel"):
+        raise ValueError(f"Unknown method '{method}'. Expected 'closed_form' or 'parallel'.")
+
+    with stage("day2.read"):
+        content = read_data(test, raw_dir)
+    with stage("day2.parse"):
+        data = parse_codes(content)
+    count("day2.ranges_parsed", len(data))
+
+    with stage("day2.solve"):
+        if method == "closed_form":
+            n_invalid, out = count_and_sum_invalid_ids_in_ranges(data, problem_part)
+            count("day2.invalid_ids", n_invalid)
+        else:
+            out = solve_ranges_in_parallel(data, problem_part, **kwargs)
     return out
 
 
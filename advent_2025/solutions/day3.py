@@ -1,84 +1,310 @@
+from functools import lru_cache
 import sys
 from pathlib import Path
-import pandas as pd
 from loguru import logger
-from typing import List
+import numpy as np
+from typing import List, Optional
+
+from advent_2025.utils.data import raw_path
+from advent_2025.utils.instrumentation import count, stage
 
 MODULE_ROOT = Path(__file__).resolve().parent.parent
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
-RAW_DATA_DIR = PROJECT_ROOT / "data" / "raw"
 
 LOGGING_LEVEL = "INFO"
 
+# Distinct inputs whose range-maximum index is kept in memory. Each index holds
+# about (log2(width) + 1) bytes per digit, around 35 MB for 50,000 100-digit banks
+BANK_CACHE_SIZE = 2
+
+
+def get_data_path(test=False, raw_dir: Optional[Path] = None) -> Path:
+    """Return the path of the Day 3 input file, in data/raw unless `raw_dir` is given."""
+    return raw_path(3, test, raw_dir)
+
 
 def load_data(test=False):
     """Read Data from Day 1 file into a list."""
-    if test:
-        file_path = RAW_DATA_DIR / "test_day_3.txt"
-    else:
-        file_path = RAW_DATA_DIR / "day_3.txt"
+    file_path = get_data_path(test)
     return [line.strip() for line in file_path.read_text().splitlines()]
 
 
-def solve_battery(n: int, k: int) -> list[int]:
+def select_peak_digits(s: str, k: int) -> str:
+    """
+    Return the largest k-digit subsequence of the digit string s.
+
+    Single pass "remove n - k digits" greedy: a digit is popped from the stack
+    whenever a larger one arrives and there are still digits left to drop, so the
+    stack always holds the best subsequence of what has been seen so far. This is
+    O(n) regardless of k and does not recurse.
+
+    Parameters
+    ----------
+    s : str
+        A string of decimal digits.
+    k : int
+        The number of digits to keep (1 <= k <= len(s)).
+    """
+    if k < 1 or k > len(s):
+        raise ValueError("k must be between 1 and the number of digits in n.")
+
+    to_remove = len(s) - k
+    stack = []
+    for digit in s:
+        while to_remove and stack and stack[-1] < digit:
+            stack.pop()
+            to_remove -= 1
+        stack.append(digit)
+
+    return "".join(stack[:k])
+
+
+def solve_battery(n: int, k: int) -> int:
     """
-    Recursively extract k peak digits from integer n.
+    Extract the k peak digits from integer n.
 
-    At each step:
-    - Consider the current string s of length m.
-    - You may choose the next digit only from s[0 : m - k + 1]
-      so that there are still k-1 digits available to the right.
-    - Take the highest digit in that prefix as the next peak,
-      then recurse to the right of its first occurrence for k-1 more digits.
+    At each step the next digit is the highest one that still leaves enough
+    digits to its right for the rest of the selection, taking its first
+    occurrence. See `select_peak_digits` for how this is computed.
 
     Parameters
     ----------
     n : int
-        A positive integer from which to extract digits.
+        A positive integer (or its digit string) from which to extract digits.
     k : int
         The number of digits to extract (1 <= k <= number of digits in n).
     """
-    s = str(n)
-    m = len(s)
+    return int(select_peak_digits(str(n), k))
 
-    if k < 1 or k > m:
-        raise ValueError("k must be between 1 and the number of digits in n.")
 
-    def _helper(sub_s: str, remaining: int) -> list[int]:
-        # Base case: only one digit to choose; take the maximum from what is left
-        if remaining == 1:
-            return [max(int(d) for d in sub_s)]
+def load_digit_matrix(battery_bank: list[str]) -> np.ndarray:
+    """
+    Stack equal-width digit strings into a 2D uint8 array (one row per battery).
+
+    Raises:
+        ValueError: If the strings differ in width or contain non-digit characters.
+    """
+    width = len(battery_bank[0]) if battery_bank else 0
+    if any(len(battery) != width for battery in battery_bank):
+        raise ValueError("All batteries must have the same number of digits.")
+
+    raw = np.frombuffer("".join(battery_bank).encode("ascii"), dtype=np.uint8)
+    matrix = (raw - ord("0")).reshape(len(battery_bank), width)
+    # Anything below '0' wraps around to a large uint8, so one comparison suffices
+    if np.any(matrix > 9):
+        raise ValueError("Batteries must only contain the digits 0-9.")
+    return matrix
 
-        m_sub = len(sub_s)
-        # We can only search up to index (m_sub - remaining) inclusive
-        # so slice end is (m_sub - remaining + 1)
-        search_end = m_sub - remaining + 1
-        prefix = sub_s[:search_end]
 
-        max_digit_char = max(prefix)
-        max_digit = int(max_digit_char)
-        first_idx = prefix.index(max_digit_char)
+def solve_digit_matrix(matrix: np.ndarray, k: int) -> int:
+    """
+    Sum the k peak digits of every row of a digit matrix at once.
+
+    Each round picks, for every row, the leftmost maximum in the window between
+    the row's last pick and the last column that still leaves enough digits for
+    the remaining rounds. The picked digits are folded into the total column by
+    column (Horner's rule) using Python integers, so k is not limited by int64.
+
+    Parameters
+    ----------
+    matrix : np.ndarray
+        2D array of digits, one row per battery.
+    k : int
+        The number of digits to extract from each row (1 <= k <= matrix width).
+    """
+    n_rows, width = matrix.shape
+    if k < 1 or k > width:
+        raise ValueError("k must be between 1 and the number of digits in n.")
 
-        # Recurse on the substring to the right of this chosen digit
-        return [max_digit] + _helper(sub_s[first_idx + 1 :], remaining - 1)
+    rows = np.arange(n_rows)
+    columns = np.arange(width)
+    positions = np.zeros(n_rows, dtype=np.intp)
+    total = 0
 
-    output_list = _helper(s, k)
+    for step in range(k):
+        window_end = width - k + step + 1
+        in_window = columns[:window_end] >= positions[:, None]
+        candidates = np.where(in_window, matrix[:, :window_end], np.int16(-1))
+        chosen = candidates.argmax(axis=1)
+        total = total * 10 + int(matrix[rows, chosen].sum(dtype=np.int64))
+        positions = chosen + 1
 
-    return int("".join(str(d) for d in output_list))
+    return total
 
 
 def solve_battery_bank(battery_bank: list, digits) -> int:
-    """Solve puzzle for a set battery bank."""
+    """
+    Solve puzzle for a set battery bank.
+
+    Banks of equal-width digit strings (or their digit matrix) are solved together
+    with `solve_digit_matrix`; anything else falls back to one battery at a time.
+    """
+    if isinstance(battery_bank, np.ndarray):
+        return solve_digit_matrix(battery_bank, digits)
+    if battery_bank and all(isinstance(battery, str) for battery in battery_bank):
+        if len({len(battery) for battery in battery_bank}) == 1:
+            return solve_digit_matrix(load_digit_matrix(battery_bank), digits)
+
     total = 0
     for battery in battery_bank:
         total += solve_battery(battery, digits)
     return total
 
 
-def solve_day_three(digits, test=False):
-    """Solve day three puzzle"""
-    data = load_data(test=test)
-    result = solve_battery_bank(data, digits)
+def parse_bank(text: str) -> list[str]:
+    """Split the text of a Day 3 input into its batteries, one per line."""
+    return [line.strip() for line in text.splitlines()]
+
+
+def load_padded_digits(battery_bank: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Stack digit strings of any widths into a 2D uint8 array, padded with zeros on the right.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The padded digits and the width of each battery.
+
+    Raises:
+        ValueError: If a battery is empty or contains non-digit characters.
+    """
+    widths = np.array([len(battery) for battery in battery_bank], dtype=np.intp)
+    if widths.size and widths.min() == 0:
+        raise ValueError("A battery must be a non-empty string of the digits 0-9.")
+
+    if widths.size and np.all(widths == widths[0]):
+        return load_digit_matrix(battery_bank), widths
+    matrix = np.zeros((widths.size, widths.max(initial=0)), dtype=np.uint8)
+    for row, battery in zip(matrix, battery_bank):
+        row[: len(battery)] = load_digit_matrix([battery])[0]
+    return matrix, widths
+
+
+class BankIndex:
+    """
+    Sparse tables over the digits of every battery in a bank, for leftmost range-maximum queries.
+
+    Level j of the table holds, for every battery and start position, the index of
+    the leftmost maximum digit in the 2**j digits from that position. Any window is
+    covered by two overlapping blocks of one level, so after an O(n log n) build
+    each round of a k-digit selection is a few NumPy gathers across all batteries,
+    and a new k costs O(k) per battery.
+
+    The table is one (levels, batteries, width) array of the narrowest unsigned
+    type that holds a column index: uint8 for batteries of up to 256 digits, so
+    100-digit banks take seven bytes per digit. Batteries of different widths are
+    padded on the right; no query window reaches the padding.
+    """
+
+    def __init__(self, battery_bank: list[str]):
+        self.digits, self.widths = load_padded_digits(battery_bank)
+        n_rows, width = self.digits.shape
+        dtype = np.min_scalar_type(max(width - 1, 0))
+
+        # _levels[length] is the table level used for a window of that many digits
+        n_levels = max(width, 1).bit_length()
+        self._levels = np.zeros(width + 1, dtype=np.intp)
+        for level in range(1, n_levels):
+            self._levels[1 << level :] = level
+
+        self.table = np.empty((n_levels, n_rows, width), dtype=dtype)
+        self.table[0] = np.arange(width, dtype=dtype)
+        values = self.digits
+        span = 1
+        for level in range(1, n_levels):
+            valid = width - 2 * span + 1
+            left_values, right_values = values[:, :valid], values[:, span : span + valid]
+            out = self.table[level, :, :valid]
+            out[...] = self.table[level - 1, :, :valid]
+            np.copyto(
+                out,
+                self.table[level - 1, :, span : span + valid],
+                where=right_values > left_values,
+            )
+            values = np.maximum(left_values, right_values)
+            span *= 2
+
+    def __len__(self) -> int:
+        return self.widths.size
+
+    def leftmost_max(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """
+        Return, for every battery, the index of the leftmost maximum digit in starts..ends.
+
+        Both bounds are inclusive and given per battery.
+        """
+        rows = np.arange(len(self))
+        levels = self._levels[ends - starts + 1]
+        left = self.table[levels, rows, starts]
+        right = self.table[levels, rows, ends - (1 << levels) + 1]
+        better = self.digits[rows, right] > self.digits[rows, left]
+        return np.where(better, right, left).astype(np.intp)
+
+    def select(self, k: int) -> np.ndarray:
+        """Return the k peak digits of every battery, one row per battery."""
+        if len(self) and (k < 1 or k > self.widths.min()):
+            raise ValueError("k must be between 1 and the number of digits in n.")
+
+        rows = np.arange(len(self))
+        chosen = np.empty((len(self), k), dtype=np.uint8)
+        positions = np.zeros(len(self), dtype=np.intp)
+        for step in range(k):
+            picks = self.leftmost_max(positions, self.widths - k + step)
+            chosen[:, step] = self.digits[rows, picks]
+            positions = picks + 1
+        return chosen
+
+    def total(self, k: int) -> int:
+        """Return the sum over the bank of each battery's k peak digits."""
+        total = 0
+        for column in self.select(k).T:
+            total = total * 10 + int(column.sum(dtype=np.int64))
+        return total
+
+
+@lru_cache(maxsize=BANK_CACHE_SIZE)
+def index_bank(text: str) -> BankIndex:
+    """
+    Build the range-maximum index for the text of a Day 3 input.
+
+    The index is cached against the text itself, so repeated queries with
+    different numbers of digits share one parse and build, and an edited file is
+    always indexed again.
+    """
+    return BankIndex(parse_bank(text))
+
+
+def clear_index_caches() -> None:
+    """Empty the bank index cache, so the next load parses and indexes from scratch."""
+    index_bank.cache_clear()
+
+
+def load_bank_index(test=False, raw_dir=None) -> BankIndex:
+    """Load the Day 3 batteries as a range-maximum index (see `index_bank`)."""
+    index = index_bank(get_data_path(test, raw_dir).read_text())
+    count("day3.lines_parsed", len(index))
+    return index
+
+
+def solve_day_three(digits, test=False, raw_dir=None, indexed=False):
+    """
+    Solve day three puzzle.
+
+    By default the bank is solved directly with `solve_battery_bank`. Set
+    `indexed` when the same input will be queried for several numbers of digits,
+    to build (or reuse) its `BankIndex` instead.
+    """
+    with stage("day3.read"):
+        text = get_data_path(test, raw_dir).read_text()
+    with stage("day3.parse"):
+        if indexed:
+            bank = index_bank(text)
+        else:
+            bank = parse_bank(text)
+            if bank and len({len(battery) for battery in bank}) == 1:
+                bank = load_digit_matrix(bank)
+    count("day3.lines_parsed", len(bank))
+    with stage("day3.solve"):
+        result = bank.total(digits) if indexed else solve_battery_bank(bank, digits)
+    count("day3.banks_solved", len(bank))
     return result
 
 
@@ -1,14 +1,31 @@
+import bisect
+import io
+import re
+from itertools import islice
 import sys
 from pathlib import Path
 from loguru import logger
-from typing import Union, List
+from typing import Iterator, Optional, TextIO, Union, List
 from collections.abc import Iterable
 import numpy as np
-from tqdm import tqdm
+
+from advent_2025.utils.data import load_cached, raw_path
+from advent_2025.utils.intervals import IntervalSet
+from advent_2025.utils.instrumentation import count, stage
 
 MODULE_ROOT = Path(__file__).resolve().parent.parent
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
-RAW_DATA_DIR = PROJECT_ROOT / "data" / "raw"
+
+# Number of ingredient IDs parsed and classified at a time when streaming
+INGREDIENT_BATCH_SIZE = 1_000_000
+
+# A single "start-end" range, optionally surrounded by whitespace
+RANGE_PATTERN = re.compile(r"\s*\d+-\d+\s*")
+
+
+def get_data_path(test=False, raw_dir: Optional[Path] = None) -> Path:
+    """Return the path of the Day 5 input file, in data/raw unless `raw_dir` is given."""
+    return raw_path(5, test, raw_dir)
 
 
 def load_data(test=False) -> tuple[list[str], list[str]]:
@@ -16,12 +33,7 @@ def load_data(test=False) -> tuple[list[str], list[str]]:
     Helper function to load either the test or real data.
     :param test: Description
     """
-    if test:
-        input_path = RAW_DATA_DIR / "test_day_5.txt"
-    else:
-        input_path = RAW_DATA_DIR / "day_5.txt"
-
-    return load_split_file(input_path)
+    return load_split_file(get_data_path(test))
 
 
 def load_split_file(filepath: str) -> tuple[list[str], list[str]]:
@@ -79,21 +91,64 @@ def get_fresh_ingredient_ranges(input_ranges: list) -> list[list[int, int]]:
 
 
 def is_ingredient_valid(ingredient: int, valid_ingredient_ranges: list[list[int, int]]) -> bool:
-    for range in valid_ingredient_ranges:
-        logger.debug("Ingredient: {}".format(ingredient))
-        if (int(ingredient) >= range[0]) & (int(ingredient) <= range[1]):
+    """Check an ingredient against every range in turn (see `is_ingredient_fresh`)."""
+    ingredient = int(ingredient)
+    for lower, upper in valid_ingredient_ranges:
+        if lower <= ingredient <= upper:
             return True
     return False
 
 
-def get_sum_valid_ingredients(ingredients: list[int], fresh_ingredients: set) -> list:
-    valid_binary = []
-    for ingredient in ingredients:
-        if is_ingredient_valid(ingredient, fresh_ingredients):
-            valid_binary.append(1)
-        else:
-            valid_binary.append(0)
-    return sum(valid_binary)
+def build_interval_index(
+    valid_ingredient_ranges: list[list[int, int]],
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Merge the fresh ranges (with `merge_ranges_array`) and return their start and
+    end points as sorted arrays.
+
+    Because the merged ranges are disjoint and sorted, an ingredient is fresh
+    exactly when it is no greater than the end of the last range starting at or
+    before it, which a binary search finds.
+
+    :param valid_ingredient_ranges: [start, end] pairs, in any order and possibly overlapping.
+    :return: int64 arrays of the merged range starts and ends.
+    :rtype: tuple[np.ndarray, np.ndarray]
+    """
+    pairs = np.array(valid_ingredient_ranges, dtype=np.int64).reshape(-1, 2)
+    return merge_ranges_array(pairs[:, 0], pairs[:, 1])
+
+
+def is_ingredient_fresh(ingredient: int, starts: np.ndarray, ends: np.ndarray) -> bool:
+    """Check a single ingredient against an interval index by binary search."""
+    position = bisect.bisect_right(starts, int(ingredient)) - 1
+    return position >= 0 and int(ingredient) <= ends[position]
+
+
+def classify_ingredients(
+    ingredients: np.ndarray, starts: np.ndarray, ends: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorised freshness check of many ingredients against an interval index.
+
+    :param ingredients: Ingredient IDs.
+    :param starts: Merged range starts from `build_interval_index`.
+    :param ends: Merged range ends from `build_interval_index`.
+    :return: A bool array, True where the ingredient is fresh.
+    :rtype: np.ndarray
+    """
+    ingredients = np.asarray(ingredients, dtype=np.int64)
+    if starts.size == 0:
+        return np.zeros(ingredients.shape, dtype=bool)
+
+    positions = np.searchsorted(starts, ingredients, side="right") - 1
+    return (positions >= 0) & (ingredients <= ends[np.maximum(positions, 0)])
+
+
+def get_sum_valid_ingredients(ingredients: list[int], fresh_ingredients: list) -> int:
+    """Count the ingredients that fall in any of the fresh ranges."""
+    starts, ends = build_interval_index(fresh_ingredients)
+    ingredient_ids = np.array([int(ingredient) for ingredient in ingredients], dtype=np.int64)
+    return int(np.count_nonzero(classify_ingredients(ingredient_ids, starts, ends)))
 
 
 def simplify_ranges(valid_ingredients: list[list[int, int]]) -> list[list[int, int]]:
@@ -136,31 +191,273 @@ def simplify_ranges(valid_ingredients: list[list[int, int]]) -> list[list[int, i
     return merged
 
 
+def parse_ranges_array(input_ranges: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Parse "start-end" strings into int64 arrays of starts and ends.
+
+    :param input_ranges: Ranges of ingredient values, expressed as strings.
+    :return: The start and end arrays, in input order.
+    :rtype: tuple[np.ndarray, np.ndarray]
+    :raises ValueError: If a line is not "start-end" or its start is after its end.
+    """
+    # Check every line holds exactly one "-" between two integers before the bulk parse
+    if not all(map(RANGE_PATTERN.fullmatch, input_ranges)):
+        bad = next(line for line in input_ranges if not RANGE_PATTERN.fullmatch(line))
+        raise ValueError(f"Each range must be of the form 'start-end', got '{bad}'.")
+
+    values = np.zeros(0, dtype=np.int64)
+    if input_ranges:
+        text = " ".join(input_ranges).replace("-", " ")
+        values = np.fromstring(text, dtype=np.int64, sep=" ")
+    values = values.reshape(-1, 2)
+    reversed_ranges = np.flatnonzero(values[:, 0] > values[:, 1])
+    if reversed_ranges.size:
+        bad = input_ranges[reversed_ranges[0]].strip()
+        raise ValueError(f"Each range must start at or before its end, got '{bad}'.")
+    return values[:, 0], values[:, 1]
+
+
+def merge_ranges_array(starts: np.ndarray, ends: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorised equivalent of `simplify_ranges` for ranges held as two arrays.
+
+    The starts and ends are sorted independently. Taking ranges in order of
+    start, the running maximum end after the first i + 1 ranges is then the
+    (i + 1)-th smallest end whenever the next start lies beyond it, so merged
+    ranges break exactly where sorted_starts[i + 1] > sorted_ends[i]. Two sorts
+    and a comparison replace the per-range Python loop.
+
+    Sorting the two independently is only valid when no range starts after it
+    ends, so reversed ranges are rejected.
+
+    :param starts: Range starts.
+    :param ends: Range ends (inclusive), aligned with `starts`.
+    :return: The merged, sorted starts and ends.
+    :rtype: tuple[np.ndarray, np.ndarray]
+    :raises ValueError: If any start is greater than its end.
+    """
+    starts = np.asarray(starts, dtype=np.int64)
+    ends = np.asarray(ends, dtype=np.int64)
+    if np.any(starts > ends):
+        i = int(np.argmax(starts > ends))
+        raise ValueError(f"Each range must start at or before its end, got {starts[i]}-{ends[i]}.")
+
+    sorted_starts = np.sort(starts)
+    sorted_ends = np.sort(ends)
+    if sorted_starts.size == 0:
+        return sorted_starts, sorted_ends
+
+    breaks = np.flatnonzero(sorted_starts[1:] > sorted_ends[:-1])
+    merged_starts = np.concatenate((sorted_starts[:1], sorted_starts[breaks + 1]))
+    merged_ends = np.concatenate((sorted_ends[breaks], sorted_ends[-1:]))
+    return merged_starts, merged_ends
+
+
+def count_range_total(starts: np.ndarray, ends: np.ndarray) -> int:
+    """Count the distinct integers covered by a set of (possibly overlapping) ranges."""
+    merged_starts, merged_ends = merge_ranges_array(starts, ends)
+    return int((merged_ends - merged_starts + 1).sum())
+
+
 def get_total_numbers_in_range(range: list[list[int, int]]) -> int:
-    simplified_range = simplify_ranges(range)
-    return sum(b - a + 1 for a, b in simplified_range)
+    pairs = np.array(range, dtype=np.int64).reshape(-1, 2)
+    return count_range_total(pairs[:, 0], pairs[:, 1])
+
 
+def build_fresh_set(input_ranges: list[str]) -> IntervalSet:
+    """
+    Build a mutable set of the fresh IDs from "start-end" strings.
 
-def day_five(test=False):
-    # Load Data
-    logger.info("Loading data range.")
-    ranges, potential_ingredients = load_data(test)
+    For freshness ranges that keep arriving: later ranges are added with
+    `add_fresh_ranges` at O(log n) each, rather than re-merging the whole list,
+    and the set's `total` is the part two answer at any point.
 
-    # Get valid ingredients list
-    logger.info("Creating valid ingredients set.")
-    valid_ingredients = get_fresh_ingredient_ranges(ranges)
+    :param input_ranges: Ranges of ingredient values, expressed as strings.
+    :raises ValueError: If a line is not "start-end" or its start is after its end.
+    """
+    return _fresh_set_from_arrays(*parse_ranges_array(input_ranges))
 
-    # Get sum of valid values
-    logger.info("Checking valid values.")
-    valid_sum = get_sum_valid_ingredients(potential_ingredients, valid_ingredients)
 
-    # Get a the sum of range values
-    logger.info("Getting range sum.")
-    sum_ranges = get_total_numbers_in_range(valid_ingredients)
+def _fresh_set_from_arrays(starts: np.ndarray, ends: np.ndarray) -> IntervalSet:
+    merged_starts, merged_ends = merge_ranges_array(starts, ends)
+    return IntervalSet.from_ranges(zip(merged_starts.tolist(), merged_ends.tolist()))
 
+
+def add_fresh_ranges(fresh: IntervalSet, input_ranges: Iterable[str]) -> IntervalSet:
+    """Add newly arrived "start-end" strings to a set from `build_fresh_set`, in place."""
+    for input_range in input_ranges:
+        if not RANGE_PATTERN.fullmatch(input_range):
+            raise ValueError(f"Each range must be of the form 'start-end', got '{input_range}'.")
+        fresh.add_range(*get_ingredient_range(input_range))
+    return fresh
+
+
+def load_fresh_set(test=False, raw_dir=None) -> IntervalSet:
+    """Load the range section of the input as an `IntervalSet` (see `build_fresh_set`)."""
+    with get_data_path(test, raw_dir).open("r", encoding="utf-8") as f:
+        return _fresh_set_from_arrays(*read_range_section(f))
+
+
+def read_range_section(f: TextIO) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Read the range section of an open input file, up to and including the first blank line.
+
+    :param f: A text file positioned at the start of the input.
+    :return: int64 arrays of the range starts and ends, in file order.
+    :rtype: tuple[np.ndarray, np.ndarray]
+    """
+    lines = []
+    for line in f:
+        if line.strip() == "":
+            break
+        lines.append(line.strip())
+    return parse_ranges_array(lines)
+
+
+def iter_ingredient_batches(
+    f: TextIO, batch_size: int = INGREDIENT_BATCH_SIZE
+) -> Iterator[np.ndarray]:
+    """
+    Yield the ingredient IDs left in an open input file as int64 arrays of up to batch_size.
+
+    Blank lines are skipped. Only one batch of lines is held in memory at a time.
+
+    :raises ValueError: If a line does not hold exactly one integer.
+    """
+    while True:
+        lines = list(islice(f, batch_size))
+        if not lines:
+            return
+        n_ingredients = sum(1 for line in lines if line.strip())
+        if n_ingredients == 0:
+            continue
+        batch = np.fromstring("".join(lines), dtype=np.int64, sep=" ")
+        if batch.size != n_ingredients:
+            raise ValueError("Each ingredient line must hold a single integer ID.")
+        yield batch
+
+
+def count_fresh_batches(
+    f: TextIO,
+    merged_starts: np.ndarray,
+    merged_ends: np.ndarray,
+    batch_size: int = INGREDIENT_BATCH_SIZE,
+) -> int:
+    """
+    Count the fresh ingredients left in an open input file, one batch at a time.
+
+    Reading and classifying are timed separately as "day5.parse" and "day5.solve".
+    """
+    batches = iter_ingredient_batches(f, batch_size)
+    valid_sum = 0
+    while True:
+        with stage("day5.parse"):
+            batch = next(batches, None)
+        if batch is None:
+            return valid_sum
+        with stage("day5.solve"):
+            valid_sum += int(
+                np.count_nonzero(classify_ingredients(batch, merged_starts, merged_ends))
+            )
+        count("day5.ingredients_parsed", batch.size)
+
+
+def count_fresh_streaming(
+    filepath: Union[str, Path], batch_size: int = INGREDIENT_BATCH_SIZE
+) -> tuple[int, int]:
+    """
+    Solve both parts while streaming the ingredient section of the input.
+
+    The range section is parsed into arrays and merged into an interval index, then
+    the ingredient IDs are read and classified one batch at a time, so memory use
+    does not grow with the number of ingredients.
+
+    :param filepath: Path to the input file.
+    :param batch_size: Number of ingredient lines classified at a time.
+    :return: The number of fresh ingredients and the number of fresh IDs in the ranges.
+    :rtype: tuple[int, int]
+    """
+    with Path(filepath).open("r", encoding="utf-8") as f:
+        with stage("day5.parse"):
+            starts, ends = read_range_section(f)
+        with stage("day5.solve"):
+            merged_starts, merged_ends = merge_ranges_array(starts, ends)
+        count("day5.ranges_parsed", starts.size)
+        count("day5.ranges_merged", starts.size - merged_starts.size)
+
+        valid_sum = count_fresh_batches(f, merged_starts, merged_ends, batch_size)
+
+    sum_ranges = int((merged_ends - merged_starts + 1).sum())
     return valid_sum, sum_ranges
 
 
+def parse_range_index(filepath: Union[str, Path]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Parse and merge the range section of an input file, without reading the ingredients.
+
+    :param filepath: Path to the input file.
+    :return: The merged range starts and ends, and a two-element array holding the
+        number of ranges in the file and the byte offset of the ingredient section.
+    :rtype: tuple[np.ndarray, np.ndarray, np.ndarray]
+    """
+    lines = []
+    offset = 0
+    with Path(filepath).open("rb") as f:
+        for line in f:
+            offset += len(line)
+            if line.strip() == b"":
+                break
+            lines.append(line.decode("utf-8").strip())
+
+    starts, ends = parse_ranges_array(lines)
+    merged_starts, merged_ends = merge_ranges_array(starts, ends)
+    return merged_starts, merged_ends, np.array([starts.size, offset], dtype=np.int64)
+
+
+def load_range_index(test=False, raw_dir=None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Load the merged ranges (see `parse_range_index`), parsed on the first run and
+    memory-mapped from the parsed-input cache after that.
+
+    Only the ranges are cached: the ingredients are always streamed from the raw
+    file, so neither run holds them all in memory. Hashing the file and mapping the
+    cached ranges are timed as "day5.read", and parsing on a cache miss as "day5.parse".
+    """
+    index = load_cached(
+        get_data_path(test, raw_dir), "fresh-ranges", parse_range_index, stage_prefix="day5"
+    )
+    merged_starts, _, (n_ranges, _) = index
+    count("day5.ranges_parsed", int(n_ranges))
+    count("day5.ranges_merged", int(n_ranges) - merged_starts.size)
+    return index
+
+
+def count_fresh_indexed(
+    filepath: Union[str, Path],
+    index: tuple[np.ndarray, np.ndarray, np.ndarray],
+    batch_size: int = INGREDIENT_BATCH_SIZE,
+) -> int:
+    """Count the fresh ingredients, streamed from just after the range section."""
+    merged_starts, merged_ends, (_, offset) = index
+    with Path(filepath).open("rb") as raw:
+        raw.seek(int(offset))
+        with io.TextIOWrapper(raw, encoding="utf-8") as f:
+            return count_fresh_batches(f, merged_starts, merged_ends, batch_size)
+
+
+def count_range_index(index: tuple[np.ndarray, np.ndarray, np.ndarray]) -> int:
+    """Count the fresh IDs covered by the merged ranges."""
+    merged_starts, merged_ends, _ = index
+    return int((merged_ends - merged_starts + 1).sum())
+
+
+def day_five(test=False, raw_dir=None):
+    index = load_range_index(test, raw_dir)
+    valid_sum = count_fresh_indexed(get_data_path(test, raw_dir), index)
+    with stage("day5.solve"):
+        return valid_sum, count_range_index(index)
+
+
 if __name__ == "__main__":
 
     logger.remove()  # remove default sink
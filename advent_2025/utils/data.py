@@ -0,0 +1,138 @@
+"""
+Shared input loading: raw input paths, memory-mapped raw bytes and a parsed-input cache.
+
+Parsed inputs are saved as .npy files under data/interim, in a directory named
+after the raw file, the parsed form and a hash of the raw file's contents. Later
+runs on the same contents skip parsing and memory-map the saved arrays instead:
+
+    >>> grid, = load_cached(raw_path(4), "grid", day4.load_grid_mmap)
+
+Editing the raw file changes its hash, so a stale parse is never returned.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+import shutil
+import tempfile
+from typing import TYPE_CHECKING, Callable, Optional, Union
+
+from advent_2025.utils.instrumentation import count, stage
+
+# Day 2 only needs `raw_path`, so NumPy is imported where it is used to keep this
+# module as quick to load as the closed-form solver
+if TYPE_CHECKING:
+    import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+RAW_DATA_DIR = PROJECT_ROOT / "data" / "raw"
+INTERIM_DATA_DIR = PROJECT_ROOT / "data" / "interim"
+
+# Bytes read at a time when hashing a raw file
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def raw_path(day: int, test: bool = False, raw_dir: Optional[Path] = None) -> Path:
+    """Return the path of a day's real (or test) input file."""
+    name = f"test_day_{day}.txt" if test else f"day_{day}.txt"
+    return Path(raw_dir or RAW_DATA_DIR) / name
+
+
+def content_hash(path: Union[str, Path]) -> str:
+    """Return a hex digest of the file's contents, read a chunk at a time."""
+    digest = hashlib.blake2b(digest_size=16)
+    with Path(path).open("rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def map_raw(path: Union[str, Path]) -> np.ndarray:
+    """
+    Return a read-only uint8 view of the file's bytes, memory-mapped rather than read.
+
+    Empty files (which cannot be mapped) give an empty array.
+    """
+    import numpy as np
+
+    if Path(path).stat().st_size == 0:
+        return np.zeros(0, dtype=np.uint8)
+    return np.memmap(path, dtype=np.uint8, mode="r")
+
+
+def cache_entry(path: Union[str, Path], name: str, cache_dir: Optional[Path] = None) -> Path:
+    """Return the cache directory for the `name` parse of the file's current contents."""
+    path = Path(path)
+    return Path(cache_dir or INTERIM_DATA_DIR) / f"{path.stem}-{name}-{content_hash(path)}"
+
+
+def load_cached(
+    path: Union[str, Path],
+    name: str,
+    parser: Callable[[Path], np.ndarray | tuple[np.ndarray, ...]],
+    cache_dir: Optional[Path] = None,
+    mmap_mode: Optional[str] = "r",
+    stage_prefix: str = "data",
+) -> tuple[np.ndarray, ...]:
+    """
+    Return the parsed form of a raw input, parsing it only if it is not already cached.
+
+    Args:
+        path (Union[str, Path]): The raw input file.
+        name (str): Names the parsed form, so one input can be cached several ways.
+            Change it when the parser's output changes.
+        parser (Callable[[Path], np.ndarray | tuple[np.ndarray, ...]]): Turns the raw file into an array or a
+            tuple of arrays.
+        cache_dir (Optional[Path]): Where to cache. Defaults to data/interim.
+        mmap_mode (Optional[str]): Passed to `np.load`. The default "r" maps the
+            cached arrays read-only without copying them; None loads them into memory.
+        stage_prefix (str): Names the instrumentation stages: "<prefix>.read" times
+            hashing the raw file and mapping the cached arrays, and "<prefix>.parse"
+            times the parser on a cache miss.
+
+    Returns:
+        tuple[np.ndarray, ...]: The parsed arrays, in the order the parser returned them.
+    """
+    import numpy as np
+
+    with stage(f"{stage_prefix}.read"):
+        entry = cache_entry(path, name, cache_dir)
+        hit = entry.is_dir()
+
+    if hit:
+        count("data.cache_hits")
+    else:
+        count("data.cache_misses")
+        with stage(f"{stage_prefix}.parse"):
+            arrays = parser(Path(path))
+            if isinstance(arrays, np.ndarray):
+                arrays = (arrays,)
+            _save_entry(entry, arrays)
+
+    with stage(f"{stage_prefix}.read"):
+        n_arrays = len(list(entry.glob("*.npy")))
+        return tuple(np.load(entry / f"{i}.npy", mmap_mode=mmap_mode) for i in range(n_arrays))
+
+
+def _save_entry(entry: Path, arrays: tuple[np.ndarray, ...]) -> None:
+    """
+    Save the arrays to a temporary directory and rename it into place.
+
+    The rename is atomic, so a cache entry either exists in full or not at all, even
+    if the process is interrupted or another process writes the same entry.
+    """
+    import numpy as np
+
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f".{entry.name}-", dir=entry.parent))
+    try:
+        for i, array in enumerate(arrays):
+            np.save(staging / f"{i}.npy", np.ascontiguousarray(array))
+        os.replace(staging, entry)
+    except OSError:
+        if not entry.is_dir():
+            raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
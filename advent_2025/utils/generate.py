@@ -0,0 +1,238 @@
+"""
+Seeded generators for synthetic puzzle inputs in each day's format.
+
+Every writer streams its output to disk a chunk at a time, so arbitrarily large
+inputs can be produced without holding them in memory. The same arguments
+(including the seed) always produce the same file.
+
+    python -m advent_2025.utils.generate 4 data/interim/day_4_large.txt --size 20000
+"""
+
+import argparse
+from pathlib import Path
+import sys
+from typing import Union
+
+import numpy as np
+
+# Number of lines (or grid rows) built in memory before each write
+CHUNK_LINES = 100_000
+
+
+def _chunks(total: int, chunk_size: int = CHUNK_LINES):
+    """Yield the sizes of successive chunks adding up to `total`."""
+    for start in range(0, total, chunk_size):
+        yield min(chunk_size, total - start)
+
+
+def _write_digit_rows(f, rows: np.ndarray) -> None:
+    """Write a 2D array of ASCII codes as newline-terminated lines."""
+    newline = np.full((rows.shape[0], 1), ord("\n"), dtype=np.uint8)
+    f.write(np.hstack((rows.astype(np.uint8), newline)).tobytes())
+
+
+def write_rotation_log(
+    path: Union[str, Path],
+    n_lines: int,
+    seed: int = 0,
+    max_distance: int = 999,
+    left_fraction: float = 0.5,
+) -> Path:
+    """
+    Write a Day 1 rotation log of `n_lines` "R<n>"/"L<n>" codes.
+
+    Args:
+        path (Union[str, Path]): Output file.
+        n_lines (int): Number of codes.
+        seed (int): Random seed.
+        max_distance (int): Largest distance of a single turn.
+        left_fraction (float): Probability that a turn is to the left.
+
+    Returns:
+        Path: The output path.
+    """
+    rng = np.random.default_rng(seed)
+    path = Path(path)
+    with path.open("w") as f:
+        for size in _chunks(n_lines):
+            left = rng.random(size) < left_fraction
+            distances = rng.integers(0, max_distance + 1, size=size)
+            f.writelines(
+                f"{'L' if is_left else 'R'}{distance}\n"
+                for is_left, distance in zip(left.tolist(), distances.tolist())
+            )
+    return path
+
+
+def write_id_ranges(
+    path: Union[str, Path],
+    n_ranges: int,
+    seed: int = 0,
+    max_digits: int = 10,
+    max_width: int = 100_000,
+    overlap: float = 0.0,
+) -> Path:
+    """
+    Write a Day 2 input of `n_ranges` comma-separated "a-b" ID ranges on one line.
+
+    Args:
+        path (Union[str, Path]): Output file.
+        n_ranges (int): Number of ranges.
+        seed (int): Random seed.
+        max_digits (int): Largest number of digits in a range start (at most 18).
+        max_width (int): Largest number of IDs in a range, less one.
+        overlap (float): Probability that a range starts inside the previous one.
+
+    Returns:
+        Path: The output path.
+    """
+    rng = np.random.default_rng(seed)
+    path = Path(path)
+    previous = None
+    with path.open("w") as f:
+        for chunk_number, size in enumerate(_chunks(n_ranges)):
+            digits = rng.integers(1, max_digits + 1, size=size)
+            starts = (10 ** (digits - 1)) * (1 + rng.random(size) * 9)
+            starts = starts.astype(np.int64)
+            ends = starts + rng.integers(0, max_width + 1, size=size)
+            overlapping = rng.random(size) < overlap
+
+            codes = []
+            for start, end, overlaps in zip(starts.tolist(), ends.tolist(), overlapping.tolist()):
+                if overlaps and previous is not None:
+                    width = end - start
+                    start = (previous[0] + previous[1]) // 2
+                    end = start + width
+                codes.append(f"{start}-{end}")
+                previous = (start, end)
+
+            f.write(("," if chunk_number else "") + ",".join(codes))
+    return path
+
+
+def write_battery_banks(
+    path: Union[str, Path], n_banks: int, width: int = 100, seed: int = 0
+) -> Path:
+    """
+    Write a Day 3 input of `n_banks` lines of `width` digits from 1 to 9.
+
+    Returns:
+        Path: The output path.
+    """
+    rng = np.random.default_rng(seed)
+    path = Path(path)
+    with path.open("wb") as f:
+        for size in _chunks(n_banks, max(1, CHUNK_LINES * 10 // max(width, 1))):
+            _write_digit_rows(f, rng.integers(ord("1"), ord("9") + 1, size=(size, width)))
+    return path
+
+
+def write_grid(
+    path: Union[str, Path], height: int, width: int, density: float = 0.6, seed: int = 0
+) -> Path:
+    """
+    Write a Day 4 grid of '@' (with probability `density`) and '.' characters.
+
+    Returns:
+        Path: The output path.
+    """
+    rng = np.random.default_rng(seed)
+    path = Path(path)
+    with path.open("wb") as f:
+        for size in _chunks(height, max(1, CHUNK_LINES * 10 // max(width, 1))):
+            rolls = rng.random((size, width)) < density
+            _write_digit_rows(f, np.where(rolls, ord("@"), ord(".")))
+    return path
+
+
+def write_ingredient_file(
+    path: Union[str, Path],
+    n_ranges: int,
+    n_ingredients: int,
+    seed: int = 0,
+    max_id: int = 10**14,
+    max_width: int = 10**11,
+    overlap: float = 0.3,
+    fresh_fraction: float = 0.5,
+) -> Path:
+    """
+    Write a Day 5 input: `n_ranges` "a-b" lines, a blank line, then `n_ingredients` IDs.
+
+    The ranges are kept in memory (as two int64 arrays) so that fresh ingredient IDs
+    can be drawn from inside them; the ingredients are streamed.
+
+    Args:
+        path (Union[str, Path]): Output file.
+        n_ranges (int): Number of fresh ranges.
+        n_ingredients (int): Number of ingredient IDs.
+        seed (int): Random seed.
+        max_id (int): Upper bound for range starts and ingredient IDs.
+        max_width (int): Largest range width.
+        overlap (float): Probability that a range starts inside the previous one.
+        fresh_fraction (float): Probability that an ingredient is drawn from a range.
+
+    Returns:
+        Path: The output path.
+    """
+    rng = np.random.default_rng(seed)
+    path = Path(path)
+
+    starts = rng.integers(0, max_id, size=n_ranges)
+    ends = starts + rng.integers(0, max_width + 1, size=n_ranges)
+    # Chained overlaps have to follow the previous range after it was moved
+    for i in np.flatnonzero(rng.random(n_ranges) < overlap).tolist():
+        if i > 0:
+            width = ends[i] - starts[i]
+            starts[i] = (starts[i - 1] + ends[i - 1]) // 2
+            ends[i] = starts[i] + width
+
+    with path.open("w") as f:
+        for chunk_start in range(0, n_ranges, CHUNK_LINES):
+            chunk = slice(chunk_start, chunk_start + CHUNK_LINES)
+            f.writelines(
+                f"{start}-{end}\n"
+                for start, end in zip(starts[chunk].tolist(), ends[chunk].tolist())
+            )
+        f.write("\n")
+
+        for size in _chunks(n_ingredients):
+            ingredients = rng.integers(0, max_id, size=size)
+            if n_ranges:
+                fresh = rng.random(size) < fresh_fraction
+                picked = rng.integers(0, n_ranges, size=size)
+                offsets = (rng.random(size) * (ends[picked] - starts[picked] + 1)).astype(np.int64)
+                ingredients = np.where(fresh, starts[picked] + offsets, ingredients)
+            f.write("\n".join(map(str, ingredients.tolist())) + "\n")
+    return path
+
+
+def write_puzzle_input(day: int, path: Union[str, Path], size: int, seed: int = 0) -> Path:
+    """
+    Write a synthetic input for `day`, where `size` sets its main dimension.
+
+    The size is the number of codes (day 1), ranges (day 2), banks (day 3), grid
+    rows and columns (day 4) or ingredients, with a fifth as many ranges (day 5).
+    """
+    if day == 1:
+        return write_rotation_log(path, size, seed=seed)
+    if day == 2:
+        return write_id_ranges(path, size, seed=seed)
+    if day == 3:
+        return write_battery_banks(path, size, seed=seed)
+    if day == 4:
+        return write_grid(path, size, size, seed=seed)
+    if day == 5:
+        return write_ingredient_file(path, max(1, size // 5), size, seed=seed)
+    raise ValueError(f"No input format for day {day}. Expected 1 to 5.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a synthetic puzzle input.")
+    parser.add_argument("day", type=int, choices=range(1, 6))
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--size", type=int, required=True)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    write_puzzle_input(args.day, args.path, args.size, seed=args.seed)
+    sys.exit(0)
@@ -0,0 +1,133 @@
+"""
+Stage timers and counters for the solvers.
+
+Solvers time their stages and bump counters through the module-level `stage` and
+`count` functions. Both do nothing but check a flag until instrumentation is
+enabled, either with `enable()` or by setting the ADVENT_INSTRUMENT environment
+variable, so they are safe to leave in place:
+
+    >>> from advent_2025.utils import instrumentation
+    >>> instrumentation.enable()
+    >>> with instrumentation.stage("day5.parse"):
+    ...     instrumentation.count("day5.ranges_parsed", 182)
+    >>> instrumentation.snapshot()["counters"]
+    {'day5.ranges_parsed': 182}
+
+Counters should be bumped once per call or batch with an aggregated value, never
+once per item inside a hot loop.
+"""
+
+from contextlib import nullcontext
+import json
+import os
+from pathlib import Path
+import time
+from typing import ContextManager, Optional, Union
+
+_DISABLED_STAGE = nullcontext()
+
+
+class _Stage:
+    """Context manager adding its elapsed time to one stage of an `Instrumentation`."""
+
+    __slots__ = ("_instrumentation", "_name", "_start")
+
+    def __init__(self, instrumentation: "Instrumentation", name: str):
+        self._instrumentation = instrumentation
+        self._name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._instrumentation.add_time(self._name, time.perf_counter() - self._start)
+        return False
+
+
+class Instrumentation:
+    """
+    Accumulated stage timings and counters.
+
+    Timings are kept per stage name as the total seconds and the number of times
+    the stage ran; counters are plain integer totals. Names are dotted, with the
+    day first, e.g. "day4.solve" or "day4.cells_removed".
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.seconds: dict[str, float] = {}
+        self.calls: dict[str, int] = {}
+        self.counters: dict[str, int] = {}
+
+    def stage(self, name: str) -> ContextManager:
+        """Return a context manager timing the `name` stage (a no-op when disabled)."""
+        if not self.enabled:
+            return _DISABLED_STAGE
+        return _Stage(self, name)
+
+    def add_time(self, name: str, seconds: float) -> None:
+        """Add one run of `seconds` to the `name` stage."""
+        self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Add `value` to the `name` counter (a no-op when disabled)."""
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + int(value)
+
+    def reset(self) -> None:
+        """Clear all timings and counters."""
+        self.seconds.clear()
+        self.calls.clear()
+        self.counters.clear()
+
+    def snapshot(self) -> dict:
+        """Return the timings and counters as plain, JSON-serialisable dicts."""
+        return {
+            "stages": {
+                name: {"seconds": seconds, "calls": self.calls[name]}
+                for name, seconds in self.seconds.items()
+            },
+            "counters": dict(self.counters),
+        }
+
+    def to_json(self, path: Optional[Union[str, Path]] = None) -> str:
+        """Return the snapshot as JSON, also writing it to `path` if given."""
+        text = json.dumps(self.snapshot(), indent=2, sort_keys=True)
+        if path is not None:
+            Path(path).write_text(text)
+        return text
+
+
+INSTRUMENTATION = Instrumentation(enabled=os.environ.get("ADVENT_INSTRUMENT", "0") != "0")
+
+
+def stage(name: str) -> ContextManager:
+    """Time the `name` stage on the shared instrumentation."""
+    return INSTRUMENTATION.stage(name)
+
+
+def count(name: str, value: int = 1) -> None:
+    """Add to the `name` counter on the shared instrumentation."""
+    INSTRUMENTATION.count(name, value)
+
+
+def enable() -> None:
+    INSTRUMENTATION.enabled = True
+
+
+def disable() -> None:
+    INSTRUMENTATION.enabled = False
+
+
+def reset() -> None:
+    INSTRUMENTATION.reset()
+
+
+def snapshot() -> dict:
+    return INSTRUMENTATION.snapshot()
+
+
+def to_json(path: Optional[Union[str, Path]] = None) -> str:
+    return INSTRUMENTATION.to_json(path)
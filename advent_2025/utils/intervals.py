@@ -0,0 +1,113 @@
+import bisect
+from typing import Iterable, Iterator
+
+
+class IntervalSet:
+    """
+    A mutable set of integers stored as sorted, disjoint, inclusive [start, end] ranges.
+
+    Ranges that overlap or sit next to each other are merged as they are added, so
+    the stored ranges are always in canonical form. Each update finds the affected
+    ranges by binary search and replaces them with a single list slice, and the
+    number of integers covered is kept up to date as it goes, so `total` is O(1).
+
+    Example:
+        >>> fresh = IntervalSet.from_ranges([[3, 5], [10, 14]])
+        >>> fresh.add_range(12, 18)
+        >>> list(fresh)
+        [(3, 5), (10, 18)]
+        >>> fresh.total
+        12
+    """
+
+    def __init__(self):
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        self._total = 0
+
+    @classmethod
+    def from_ranges(cls, ranges: Iterable[Iterable[int]]) -> "IntervalSet":
+        """Build a set from an iterable of [start, end] pairs."""
+        interval_set = cls()
+        for start, end in ranges:
+            interval_set.add_range(int(start), int(end))
+        return interval_set
+
+    @property
+    def total(self) -> int:
+        """The number of integers in the set."""
+        return self._total
+
+    def add_range(self, start: int, end: int) -> None:
+        """
+        Add every integer in [start, end] to the set.
+
+        Raises:
+            ValueError: If start is greater than end.
+        """
+        if start > end:
+            raise ValueError(f"Invalid range [{start}, {end}]: start is greater than end.")
+
+        # Ranges ending at or after start - 1 and starting at or before end + 1 touch
+        first = bisect.bisect_left(self._ends, start - 1)
+        last = bisect.bisect_right(self._starts, end + 1)
+        if first < last:
+            start = min(start, self._starts[first])
+            end = max(end, self._ends[last - 1])
+
+        self._total -= self._covered(first, last)
+        self._starts[first:last] = [start]
+        self._ends[first:last] = [end]
+        self._total += end - start + 1
+
+    def remove_range(self, start: int, end: int) -> None:
+        """
+        Remove every integer in [start, end] from the set.
+
+        Raises:
+            ValueError: If start is greater than end.
+        """
+        if start > end:
+            raise ValueError(f"Invalid range [{start}, {end}]: start is greater than end.")
+
+        first = bisect.bisect_left(self._ends, start)
+        last = bisect.bisect_right(self._starts, end)
+        if first >= last:
+            return
+
+        # Keep whatever sticks out either side of the removed range
+        new_starts = []
+        new_ends = []
+        if self._starts[first] < start:
+            new_starts.append(self._starts[first])
+            new_ends.append(start - 1)
+        if self._ends[last - 1] > end:
+            new_starts.append(end + 1)
+            new_ends.append(self._ends[last - 1])
+
+        self._total -= self._covered(first, last)
+        self._starts[first:last] = new_starts
+        self._ends[first:last] = new_ends
+        self._total += sum(e - s + 1 for s, e in zip(new_starts, new_ends))
+
+    def contains(self, value: int) -> bool:
+        """Return True if `value` is in the set."""
+        position = bisect.bisect_right(self._starts, value) - 1
+        return position >= 0 and value <= self._ends[position]
+
+    def __contains__(self, value: int) -> bool:
+        return self.contains(value)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return zip(self._starts, self._ends)
+
+    def __len__(self) -> int:
+        """The number of disjoint ranges (see `total` for the number of integers)."""
+        return len(self._starts)
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({[list(interval) for interval in self]})"
+
+    def _covered(self, first: int, last: int) -> int:
+        """Number of integers in the stored ranges first..last-1."""
+        return sum(self._ends[i] - self._starts[i] + 1 for i in range(first, last))
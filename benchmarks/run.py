@@ -0,0 +1,285 @@
+"""
+Throughput benchmarks for every day's solver.
+
+Each day gets a distinct seeded input at each scale (1x, 10x, 100x, 1000x the
+size of the puzzle input by default), written by `write_puzzle_input`, and the
+day's own entry points solve every part of it, reading the input from a scratch directory
+through their `raw_dir` argument. The read, parse and solve times come from the
+stages the solvers record themselves, so they split the work exactly where the
+code does. Every repeat starts with empty parsed-input and index caches. For
+every stage the report gives the best time over a few repeats, items per second,
+latency per item and the scaling exponent fitted across sizes (about 1 for linear
+work, 2 for quadratic).
+
+With --tile-input the puzzle input (or, when data/raw has none, a synthetic one
+of about the same size) is instead repeated to scale it. Repeated lines dedupe
+in caches and merge away, so only use this to check behaviour on the real data,
+not to fit exponents. Run from the project root:
+
+    python -m benchmarks.run
+    python -m benchmarks.run --days 4 5 --factors 1 10 100 --json bench.json
+    python -m benchmarks.run --days 1 --tile-input
+"""
+
+import argparse
+from dataclasses import asdict, dataclass
+import json
+from pathlib import Path
+import shutil
+import sys
+import tempfile
+from typing import Any, Callable, Optional
+
+from loguru import logger
+import numpy as np
+
+from advent_2025.solutions import day1, day2, day3, day4, day5
+from advent_2025.utils import data, instrumentation
+from advent_2025.utils.data import raw_path
+from advent_2025.utils.generate import write_puzzle_input
+
+DEFAULT_FACTORS = [1, 10, 100, 1000]
+STAGES = ("read", "parse", "solve")
+
+# Sizes passed to `write_puzzle_input` to match the real puzzle inputs
+SYNTHETIC_SIZES = {1: 4500, 2: 40, 3: 200, 4: 140, 5: 1000}
+
+
+@dataclass
+class DayBenchmark:
+    """How to scale one day's input, solve every part of it and count its items."""
+
+    day: int
+    scale: Callable[[str, int], str]
+    solve: Callable[[Path], Any]
+    count_items: Callable[[str], int]
+    # Size passed to `write_puzzle_input` for a scale factor
+    size: Optional[Callable[[int], int]] = None
+
+    def __post_init__(self):
+        if self.size is None:
+            self.size = lambda factor: SYNTHETIC_SIZES[self.day] * factor
+
+
+@dataclass
+class StageResult:
+    day: int
+    factor: int
+    stage: str
+    items: int
+    seconds: float
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.seconds if self.seconds else float("inf")
+
+    @property
+    def latency_us(self) -> float:
+        return 1e6 * self.seconds / self.items if self.items else float("nan")
+
+
+def repeat_lines(text: str, factor: int) -> str:
+    """Repeat every line of a line-based input `factor` times over."""
+    body = text.rstrip("\n") + "\n"
+    return body * factor
+
+
+def repeat_ranges(text: str, factor: int) -> str:
+    """Repeat a comma-separated list of ranges `factor` times over."""
+    return ",".join([text.strip()] * factor)
+
+
+def repeat_sections(text: str, factor: int) -> str:
+    """Repeat both the range section and the ingredient section of a Day 5 input."""
+    ranges, _, ingredients = text.partition("\n\n")
+    return repeat_lines(ranges, factor) + "\n" + repeat_lines(ingredients, factor)
+
+
+def count_lines(text: str) -> int:
+    return len(text.split())
+
+
+def count_cells(text: str) -> int:
+    return sum(len(line) for line in text.split())
+
+
+BENCHMARKS = {
+    1: DayBenchmark(
+        day=1,
+        scale=repeat_lines,
+        solve=lambda raw_dir: [day1.day_one(part, raw_dir=raw_dir) for part in (1, 2)],
+        count_items=count_lines,
+    ),
+    2: DayBenchmark(
+        day=2,
+        scale=repeat_ranges,
+        solve=lambda raw_dir: [day2.solve_day_two(part, raw_dir=raw_dir) for part in (1, 2)],
+        count_items=lambda text: text.count(",") + 1,
+    ),
+    3: DayBenchmark(
+        day=3,
+        scale=repeat_lines,
+        solve=lambda raw_dir: [
+            day3.solve_day_three(digits, raw_dir=raw_dir, indexed=indexed)
+            for indexed in (False, True)
+            for digits in (2, 12)
+        ],
+        count_items=count_lines,
+    ),
+    4: DayBenchmark(
+        day=4,
+        scale=repeat_lines,
+        solve=lambda raw_dir: (
+            day4.day_four_part_one(raw_dir=raw_dir),
+            day4.day_four_part_two(raw_dir=raw_dir),
+        ),
+        count_items=count_cells,
+        # The size is the side of a square grid, so the cells grow with the factor
+        size=lambda factor: round(SYNTHETIC_SIZES[4] * factor**0.5),
+    ),
+    5: DayBenchmark(
+        day=5,
+        scale=repeat_sections,
+        solve=lambda raw_dir: day5.day_five(raw_dir=raw_dir),
+        count_items=count_lines,
+    ),
+}
+
+
+def get_base_input(day: int, work_dir: Path) -> Path:
+    """Use the real puzzle input when it is available, otherwise a synthetic one."""
+    path = raw_path(day)
+    if path.exists():
+        return path
+    return write_puzzle_input(day, work_dir / f"day_{day}_synthetic.txt", SYNTHETIC_SIZES[day])
+
+
+def time_stages(benchmark: DayBenchmark, raw_dir: Path, repeat: int) -> dict[str, float]:
+    """
+    Return the best seconds recorded for each stage over `repeat` cold runs.
+
+    Instrumentation must be enabled and the parsed-input cache pointed somewhere
+    disposable, as it is emptied before every run.
+    """
+    best = dict.fromkeys(STAGES, float("inf"))
+    for _ in range(repeat):
+        shutil.rmtree(data.INTERIM_DATA_DIR, ignore_errors=True)
+        day3.clear_index_caches()
+        instrumentation.reset()
+        benchmark.solve(raw_dir)
+
+        stages = instrumentation.snapshot()["stages"]
+        for stage in STAGES:
+            seconds = stages.get(f"day{benchmark.day}.{stage}", {}).get("seconds", 0.0)
+            best[stage] = min(best[stage], seconds)
+    return best
+
+
+def run_day(
+    benchmark: DayBenchmark,
+    factors: list[int],
+    repeat: int,
+    work_dir: Path,
+    tile_input: bool = False,
+) -> list[StageResult]:
+    """Time every stage of one day's solver at each scale factor."""
+    if tile_input:
+        base_text = get_base_input(benchmark.day, work_dir).read_text()
+    raw_dir = work_dir / "raw"
+    raw_dir.mkdir(exist_ok=True)
+
+    results = []
+    for factor in factors:
+        path = raw_path(benchmark.day, raw_dir=raw_dir)
+        if tile_input:
+            path.write_text(benchmark.scale(base_text, factor))
+        else:
+            write_puzzle_input(benchmark.day, path, benchmark.size(factor))
+
+        items = benchmark.count_items(path.read_text())
+        for stage, seconds in time_stages(benchmark, raw_dir, repeat).items():
+            results.append(StageResult(benchmark.day, factor, stage, items, seconds))
+        path.unlink()
+    return results
+
+
+def fit_scaling_exponent(results: list[StageResult]) -> float:
+    """Slope of log(time) against log(items): ~1 for linear work, ~2 for quadratic."""
+    points = [(r.items, r.seconds) for r in results if r.items > 0 and r.seconds > 0]
+    if len({items for items, _ in points}) < 2:
+        return float("nan")
+    items, seconds = np.log(np.array(points, dtype=float)).T
+    return float(np.polyfit(items, seconds, 1)[0])
+
+
+def format_report(results: list[StageResult]) -> str:
+    """Render the results as a plain-text table, with one exponent per day and stage."""
+    lines = [
+        f"{'day':>3} {'stage':<6} {'factor':>6} {'items':>12} {'seconds':>10} "
+        f"{'items/s':>12} {'us/item':>10} {'exponent':>8}"
+    ]
+    for day in sorted({r.day for r in results}):
+        for stage in STAGES:
+            stage_results = [r for r in results if r.day == day and r.stage == stage]
+            exponent = fit_scaling_exponent(stage_results)
+            for r in stage_results:
+                lines.append(
+                    f"{r.day:>3} {r.stage:<6} {r.factor:>6} {r.items:>12} {r.seconds:>10.4f} "
+                    f"{r.items_per_second:>12.0f} {r.latency_us:>10.3f} {exponent:>8.2f}"
+                )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--days", type=int, nargs="+", default=sorted(BENCHMARKS))
+    parser.add_argument("--factors", type=int, nargs="+", default=DEFAULT_FACTORS)
+    parser.add_argument("--repeat", type=int, default=3, help="Best of this many runs.")
+    parser.add_argument("--json", type=Path, help="Also write the raw results here.")
+    parser.add_argument(
+        "--tile-input",
+        action="store_true",
+        help="Scale by repeating the puzzle input rather than generating distinct inputs.",
+    )
+    args = parser.parse_args(argv)
+
+    results = []
+    interim_dir = data.INTERIM_DATA_DIR
+    with tempfile.TemporaryDirectory() as work_dir:
+        # Parse from scratch on every run, without touching the real cache
+        data.INTERIM_DATA_DIR = Path(work_dir) / "interim"
+        instrumentation.enable()
+        try:
+            for day in args.days:
+                results.extend(
+                    run_day(
+                        BENCHMARKS[day], args.factors, args.repeat, Path(work_dir), args.tile_input
+                    )
+                )
+        finally:
+            instrumentation.disable()
+            data.INTERIM_DATA_DIR = interim_dir
+
+    print(format_report(results))
+
+    if args.json:
+        exponents = {
+            f"day{day}.{stage}": fit_scaling_exponent(
+                [r for r in results if r.day == day and r.stage == stage]
+            )
+            for day in args.days
+            for stage in STAGES
+        }
+        records = [
+            dict(asdict(r), items_per_second=r.items_per_second, latency_us=r.latency_us)
+            for r in results
+        ]
+        args.json.write_text(json.dumps({"results": records, "exponents": exponents}, indent=2))
+
+    return 0
+
+
+if __name__ == "__main__":
+    logger.remove()  # the solvers' debug logging would swamp the report
+    logger.add(sys.stderr, level="INFO")
+    sys.exit(main())
@@ -0,0 +1,11 @@
+import pytest
+
+from advent_2025.utils import data
+
+
+@pytest.fixture(autouse=True)
+def interim_dir(tmp_path, monkeypatch):
+    """Keep the parsed-input cache of every test out of the working tree's data/interim."""
+    path = tmp_path / "interim"
+    monkeypatch.setattr(data, "INTERIM_DATA_DIR", path)
+    return path
@@ -0,0 +1,127 @@
+import shutil
+
+import numpy as np
+import pytest
+
+from advent_2025.solutions import day1, day2, day3, day4, day5
+from advent_2025.utils import data
+
+
+class TestPaths:
+    def test_raw_path(self, tmp_path):
+        assert data.raw_path(3) == data.RAW_DATA_DIR / "day_3.txt"
+        assert data.raw_path(3, test=True, raw_dir=tmp_path) == tmp_path / "test_day_3.txt"
+
+    def test_content_hash(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(data, "HASH_CHUNK_SIZE", 3)
+        a = tmp_path / "a.txt"
+        b = tmp_path / "b.txt"
+        a.write_text("R10\nL5\n")
+        b.write_text("R10\nL5\n")
+        assert data.content_hash(a) == data.content_hash(b)
+        b.write_text("R10\nL6\n")
+        assert data.content_hash(a) != data.content_hash(b)
+
+
+class TestRawDir:
+    @pytest.mark.parametrize(
+        "day, solve, expected",
+        [
+            (1, lambda raw_dir: day1.day_one(2, raw_dir=raw_dir), 6),
+            (2, lambda raw_dir: day2.solve_day_two(1, raw_dir=raw_dir), 1227775554),
+            (3, lambda raw_dir: day3.solve_day_three(2, raw_dir=raw_dir), 357),
+            (4, lambda raw_dir: day4.day_four_part_two(raw_dir=raw_dir), 43),
+            (4, lambda raw_dir: day4.day_four_part_one(raw_dir=raw_dir, engine="packed"), 13),
+            (5, lambda raw_dir: day5.day_five(raw_dir=raw_dir), (3, 14)),
+        ],
+    )
+    def test_day_reads_from_raw_dir(self, tmp_path, day, solve, expected):
+        shutil.copy(data.raw_path(day, test=True), data.raw_path(day, raw_dir=tmp_path))
+        assert solve(tmp_path) == expected
+
+
+class TestMapRaw:
+    def test_bytes(self, tmp_path):
+        path = tmp_path / "a.txt"
+        path.write_bytes(b"@.\n")
+        raw = data.map_raw(path)
+        assert raw.tobytes() == b"@.\n"
+        assert not raw.flags.writeable
+
+    def test_empty(self, tmp_path):
+        path = tmp_path / "a.txt"
+        path.write_bytes(b"")
+        assert data.map_raw(path).size == 0
+
+
+class TestLoadCached:
+    @pytest.fixture
+    def raw(self, tmp_path):
+        path = tmp_path / "day_0.txt"
+        path.write_text("1\n2\n3\n")
+        return path
+
+    @staticmethod
+    def parser(calls):
+        def parse(path):
+            calls.append(path)
+            values = np.array(path.read_text().split(), dtype=np.int64)
+            return values, values * 2
+
+        return parse
+
+    def test_parses_once(self, raw, tmp_path):
+        calls = []
+        cache_dir = tmp_path / "interim"
+        first = data.load_cached(raw, "values", self.parser(calls), cache_dir=cache_dir)
+        second = data.load_cached(raw, "values", self.parser(calls), cache_dir=cache_dir)
+        assert calls == [raw]
+        for a, b in zip(first, second):
+            assert a.tolist() == b.tolist()
+        assert second[1].tolist() == [2, 4, 6]
+
+    def test_memory_mapped(self, raw, tmp_path):
+        values, _ = data.load_cached(raw, "values", self.parser([]), cache_dir=tmp_path)
+        assert isinstance(values, np.memmap)
+        assert not values.flags.writeable
+
+        values, _ = data.load_cached(
+            raw, "values", self.parser([]), cache_dir=tmp_path, mmap_mode=None
+        )
+        assert not isinstance(values, np.memmap)
+
+    def test_single_array(self, raw, tmp_path):
+        arrays = data.load_cached(
+            raw, "first", lambda p: self.parser([])(p)[0], cache_dir=tmp_path
+        )
+        assert len(arrays) == 1
+        assert arrays[0].tolist() == [1, 2, 3]
+
+    def test_content_change_reparses(self, raw, tmp_path):
+        calls = []
+        data.load_cached(raw, "values", self.parser(calls), cache_dir=tmp_path)
+        raw.write_text("4\n5\n")
+        values, _ = data.load_cached(raw, "values", self.parser(calls), cache_dir=tmp_path)
+        assert len(calls) == 2
+        assert values.tolist() == [4, 5]
+
+    def test_names_are_separate(self, raw, tmp_path):
+        calls = []
+        data.load_cached(raw, "a", self.parser(calls), cache_dir=tmp_path)
+        data.load_cached(raw, "b", self.parser(calls), cache_dir=tmp_path)
+        assert len(calls) == 2
+
+    def test_failed_parse_leaves_no_entry(self, raw, tmp_path):
+        def fail(path):
+            raise ValueError("bad input")
+
+        with pytest.raises(ValueError):
+            data.load_cached(raw, "values", fail, cache_dir=tmp_path)
+        assert list(tmp_path.glob("day_0-*")) == []
+
+    def test_grid(self, tmp_path):
+        path = tmp_path / "day_4.txt"
+        path.write_text("@.@\n.@.\n")
+        (grid,) = data.load_cached(path, "grid", day4.load_grid_mmap, cache_dir=tmp_path)
+        assert grid.dtype == np.uint8
+        assert grid.tolist() == [[1, 0, 1], [0, 1, 0]]
@@ -1,5 +1,6 @@
 import pytest
 import sys
+import numpy as np
 
 from pathlib import Path
 
@@ -59,4 +60,138 @@ class TestComplete():
 
     def test_part_two(self):
         x = d.day_one(test=True, problem_part=2)
-        assert x == 6
\ No newline at end of file
+        assert x == 6
+
+class TestVectorised():
+    def test_count_zeroes_part_one(self):
+        n_zeroes, position = d.count_zeroes([-68, -30, 48], 50, problem_part=1)
+        assert (n_zeroes, position) == (1, 0)
+
+    def test_count_zeroes_empty(self):
+        assert d.count_zeroes([], 50, problem_part=2) == (0, 50)
+
+    def test_left_from_zero(self):
+        assert d.calculate_solution_vectorised([-5], 0, problem_part=2) == 0
+
+    def test_full_turns(self):
+        codes = [150, -150, -200, 0, -100, 1000]
+        assert d.calculate_solution_vectorised(codes, 50, problem_part=2) == 16
+
+    def test_matches_loop(self):
+        rng = np.random.default_rng(2025)
+        codes = rng.integers(-350, 350, size=2000).tolist()
+        for problem_part in (1, 2):
+            expected = d.calculate_solution(codes, 50, problem_part)
+            assert d.calculate_solution_vectorised(codes, 50, problem_part) == expected
+
+    def test_invalid_part(self):
+        with pytest.raises(ValueError):
+            d.count_zeroes([1], 50, problem_part=3)
+
+    def test_largest_codes_do_not_overflow(self):
+        data = b"R999999999999999999\n" * 20 + b"L999999999999999999\n" * 3
+        codes = d.parse_directions_bytes(data)
+        for problem_part in (1, 2):
+            expected = d.calculate_solution(codes.tolist(), 50, problem_part)
+            assert d.calculate_solution_vectorised(codes, 50, problem_part) == expected
+        assert d.calculate_solution_vectorised(codes, 50, 2) == 230000000000000000
+
+
+class TestStreaming():
+    def test_matches_day_one(self):
+        for problem_part in (1, 2):
+            checkpoint = d.solve_stream(d.get_data_path(test=True), problem_part, block_size=7)
+            assert checkpoint.n_zeroes == d.day_one(problem_part, test=True)
+
+    def test_no_trailing_newline(self, tmp_path):
+        path = tmp_path / "log.txt"
+        path.write_text("R50\nL200")
+        checkpoint = d.solve_stream(path, problem_part=2, block_size=3, final=True)
+        assert (checkpoint.n_zeroes, checkpoint.position, checkpoint.offset) == (3, 0, 8)
+
+    def test_partial_line_not_checkpointed(self, tmp_path):
+        path = tmp_path / "log.txt"
+        path.write_text("R50\nL20")
+        checkpoint = d.solve_stream(path, problem_part=2)
+        assert (checkpoint.n_zeroes, checkpoint.position, checkpoint.offset) == (1, 0, 4)
+
+        # The half-written "L20" turns out to be "L200"
+        with path.open("a") as f:
+            f.write("0\nR10\n")
+        resumed = d.solve_stream(path, problem_part=2, checkpoint=checkpoint)
+        assert resumed.n_zeroes == d.solve_stream(path, problem_part=2).n_zeroes == 3
+        assert resumed.offset == path.stat().st_size
+
+    def test_resume_from_checkpoint(self, tmp_path):
+        path = tmp_path / "log.txt"
+        codes = ["L68", "L30", "R48", "L5", "R60", "L55", "L1", "L99", "R14", "L82"]
+        path.write_text("\n".join(codes[:4]) + "\n")
+        checkpoint = d.solve_stream(path, problem_part=2)
+        d.save_checkpoint(checkpoint, tmp_path / "checkpoint.json")
+
+        with path.open("a") as f:
+            f.write("\n".join(codes[4:]) + "\n")
+        resumed = d.solve_stream(
+            path, problem_part=2, checkpoint=d.load_checkpoint(tmp_path / "checkpoint.json")
+        )
+        assert resumed.n_zeroes == 6
+        assert resumed.offset == path.stat().st_size
+
+    def test_wrong_part_checkpoint(self, tmp_path):
+        path = tmp_path / "log.txt"
+        path.write_text("R50\n")
+        with pytest.raises(ValueError):
+            d.solve_stream(path, problem_part=1, checkpoint=d.DialCheckpoint(problem_part=2))
+
+    def test_empty_line(self, tmp_path):
+        path = tmp_path / "log.txt"
+        path.write_text("R50\n\nL5\n")
+        with pytest.raises(ValueError):
+            d.solve_stream(path, problem_part=1)
+
+
+class TestParseDirectionsBytes():
+    def test_multiple(self):
+        x = d.parse_directions_bytes(b"L2\nR8\nL99\n")
+        assert x.tolist() == [-2, 8, -99]
+
+    def test_no_trailing_newline(self):
+        assert d.parse_directions_bytes(b"R10\nL0").tolist() == [10, 0]
+
+    def test_empty(self):
+        assert d.parse_directions_bytes(b"").tolist() == []
+
+    def test_windows_line_endings(self):
+        assert d.parse_directions_bytes(b"R10\r\nL5\r\n").tolist() == [10, -5]
+
+    def test_matches_convert_directions(self):
+        rng = np.random.default_rng(7)
+        codes = [
+            f"{'LR'[right]}{distance}"
+            for right, distance in zip(
+                rng.integers(0, 2, size=5000), rng.integers(0, 10**6, size=5000)
+            )
+        ]
+        x = d.parse_directions_bytes("\n".join(codes).encode())
+        assert x.tolist() == d.convert_directions(codes)
+
+    def test_longest_code(self):
+        x = d.parse_directions_bytes(b"L123456789012345678\n")
+        assert x.tolist() == [-123456789012345678]
+
+    @pytest.mark.parametrize(
+        "data, message",
+        [
+            (b"R5\nX5\n", "Invalid prefix 'X'"),
+            (b"R5\n\nL5\n", "Empty string"),
+            (b"\n", "Empty string"),
+            (b"R5\nL\n", "Invalid numeric value"),
+            (b"R5\nL5a\n", "Invalid numeric value"),
+        ],
+    )
+    def test_errors_match_convert_directions(self, data, message):
+        with pytest.raises(ValueError, match=message):
+            d.parse_directions_bytes(data)
+
+    def test_load_moves(self):
+        assert d.load_moves(test=True).tolist() == d.load_data(test=True)
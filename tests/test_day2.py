@@ -1,5 +1,6 @@
 import pytest
 import sys
+import numpy as np
 
 from pathlib import Path
 
@@ -163,3 +164,132 @@ class TestExample:
     def test_full_example_part_one(self):
         x = d.solve_day_two(problem_part=2, test=True)
         assert x == 4174379265
+
+
+class TestIterInvalidIds:
+    def test_repeat_periods_part_one(self):
+        assert d.get_repeat_periods(6, problem_part=1) == [3]
+        assert d.get_repeat_periods(5, problem_part=1) == []
+
+    def test_repeat_periods_part_two(self):
+        assert d.get_repeat_periods(6, problem_part=2) == [2, 3]
+        assert d.get_repeat_periods(8, problem_part=2) == [4]
+        assert d.get_repeat_periods(7, problem_part=2) == [1]
+
+    def test_repeat_multiplier(self):
+        assert d.get_repeat_multiplier(6, 2) == 10101
+
+    def test_example_part_one(self):
+        assert list(d.iter_invalid_ids(95, 115, problem_part=1)) == [99]
+
+    def test_example_part_two(self):
+        assert list(d.iter_invalid_ids(95, 115, problem_part=2)) == [99, 111]
+
+    def test_no_duplicates_part_two(self):
+        out = list(d.iter_invalid_ids(222220, 222224, problem_part=2))
+        assert out == [222222]
+
+    def test_matches_brute_force(self):
+        for problem_part in (1, 2):
+            expected = [n for n in range(1, 200000) if d.is_invalid_id(n, problem_part)]
+            assert list(d.iter_invalid_ids(1, 199999, problem_part)) == expected
+
+    def test_wide_range(self):
+        out = list(d.iter_invalid_ids(10**9, 10**10 - 1, problem_part=1))
+        assert len(out) == 90000
+        assert (out[0], out[-1]) == (1000010000, 9999999999)
+
+
+class TestCountAndSumInvalidIds:
+    def test_mobius(self):
+        assert [d.get_mobius(n) for n in range(1, 11)] == [1, -1, -1, 0, -1, 1, -1, 0, 0, 1]
+
+    def test_example_range(self):
+        assert d.count_and_sum_invalid_ids(998, 1012, problem_part=1) == (1, 1010)
+        assert d.count_and_sum_invalid_ids(998, 1012, problem_part=2) == (2, 2009)
+
+    def test_empty_range(self):
+        assert d.count_and_sum_invalid_ids(2121212118, 2121212124, problem_part=1) == (0, 0)
+
+    def test_matches_brute_force(self):
+        for problem_part in (1, 2):
+            for start, end in [(1, 200000), (95, 115), (1188511880, 1188511890), (5, 7)]:
+                ids = [n for n in range(start, end + 1) if d.is_invalid_id(n, problem_part)]
+                out = d.count_and_sum_invalid_ids(start, end, problem_part)
+                assert out == (len(ids), sum(ids))
+
+    def test_matches_generator_on_wide_range(self):
+        start, end = 12345, 98765432109
+        for problem_part in (1, 2):
+            ids = list(d.iter_invalid_ids(start, end, problem_part))
+            assert d.count_and_sum_invalid_ids(start, end, problem_part) == (len(ids), sum(ids))
+
+    def test_huge_range(self):
+        count, _ = d.count_and_sum_invalid_ids(1, 10**18, problem_part=1)
+        assert count == sum(9 * 10 ** (k - 1) for k in range(1, 10))
+
+
+class TestParallel:
+    def test_iter_range_chunks(self):
+        out = list(d.iter_range_chunks(["1-10", "20-21"], chunk_size=4))
+        assert out == [(1, 4), (5, 8), (9, 10), (20, 21)]
+
+    def test_iter_range_chunks_bad_size(self):
+        with pytest.raises(ValueError):
+            list(d.iter_range_chunks(["1-10"], chunk_size=0))
+
+    def test_count_and_sum_invalid_ids_in_chunk(self):
+        assert d.count_and_sum_invalid_ids_in_chunk(998, 1012, problem_part=2) == (2, 2009)
+
+    def test_parallel_matches_closed_form(self):
+        for problem_part in (1, 2):
+            x = d.solve_day_two(
+                problem_part=problem_part,
+                test=True,
+                method="parallel",
+                chunk_size=5,
+                max_workers=2,
+            )
+            assert x == d.solve_day_two(problem_part=problem_part, test=True)
+
+    def test_parallel_small_window(self, monkeypatch):
+        monkeypatch.setattr(d, "IN_FLIGHT_PER_WORKER", 1)
+        codes = ["11-22", "95-115", "998-1012", "1188511880-1188511890"]
+        x = d.solve_ranges_in_parallel(codes, problem_part=2, chunk_size=3, max_workers=2)
+        assert x == d.count_and_sum_invalid_ids_in_ranges(codes, 2)[1]
+
+    def test_unknown_method(self):
+        with pytest.raises(ValueError):
+            d.solve_day_two(problem_part=1, test=True, method="abacus")
+
+
+class TestInvalidIdArray:
+    def test_digit_lengths_at_powers_of_ten(self):
+        x = np.array([0, 9, 10, 99, 100, 10**15 - 1, 10**15, 10**18 - 1, 10**18], dtype=np.int64)
+        expected = [1, 1, 2, 2, 3, 15, 16, 18, 19]
+        assert d.get_digit_lengths(x).tolist() == expected
+
+    def test_part_one(self):
+        x = np.array([11, 12, 1212, 12345, 123123, 111], dtype=np.int64)
+        expected = [True, False, True, False, True, False]
+        assert d.is_invalid_id_array(x, problem_part=1).tolist() == expected
+
+    def test_part_two(self):
+        x = np.array([111, 12, 123123123, 2121212121, 1010101011], dtype=np.int64)
+        expected = [True, False, True, True, False]
+        assert d.is_invalid_id_array(x, problem_part=2).tolist() == expected
+
+    def test_matches_scalar_predicate(self):
+        x = np.arange(0, 200000, dtype=np.int64)
+        for problem_part in (1, 2):
+            expected = [d.is_invalid_id(n, problem_part) for n in x.tolist()]
+            assert d.is_invalid_id_array(x, problem_part).tolist() == expected
+
+    def test_large_ids(self):
+        x = np.array([919191919191919191, 9191919191919191919, 9111111111111111111])
+        assert d.is_invalid_id_array(x, problem_part=2).tolist() == [True, False, False]
+        assert d.is_invalid_id_array(np.array([8888888888888888888]), problem_part=2).all()
+
+    def test_negative_ids(self):
+        with pytest.raises(ValueError):
+            d.is_invalid_id_array(np.array([-11]), problem_part=1)
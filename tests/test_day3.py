@@ -1,5 +1,9 @@
 import pytest
+import itertools
+import os
+import random
 import sys
+import numpy as np
 
 from pathlib import Path
 
@@ -32,3 +36,128 @@ class TestFullSolution:
     def test_part_two(self):
         x = d.solve_day_three(digits=12, test=True)
         assert x == 3121910778619
+
+
+class TestSelectPeakDigits:
+    def test_part_two_example(self):
+        assert d.select_peak_digits("234234234234278", 12) == "434234234278"
+
+    def test_keep_all(self):
+        assert d.select_peak_digits("1234", 4) == "1234"
+
+    def test_invalid_k(self):
+        with pytest.raises(ValueError):
+            d.select_peak_digits("1234", 5)
+        with pytest.raises(ValueError):
+            d.solve_battery(1234, 0)
+
+    def test_matches_exhaustive_search(self):
+        rng = random.Random(3)
+        for _ in range(200):
+            s = "".join(rng.choice("123456789") for _ in range(rng.randint(1, 9)))
+            k = rng.randint(1, len(s))
+            best = max("".join(c) for c in itertools.combinations(s, k))
+            assert d.select_peak_digits(s, k) == best
+
+    def test_long_bank(self):
+        rng = random.Random(5)
+        s = "".join(rng.choice("123456789") for _ in range(100000))
+        out = d.select_peak_digits(s, 3000)
+        assert len(out) == 3000
+        assert out[0] == "9"
+
+
+class TestDigitMatrix:
+    def test_load_digit_matrix(self):
+        x = d.load_digit_matrix(["120", "907"])
+        assert x.dtype == np.uint8
+        assert x.tolist() == [[1, 2, 0], [9, 0, 7]]
+
+    def test_load_digit_matrix_ragged(self):
+        with pytest.raises(ValueError):
+            d.load_digit_matrix(["12", "345"])
+
+    def test_load_digit_matrix_bad_character(self):
+        with pytest.raises(ValueError):
+            d.load_digit_matrix(["12", "3a"])
+
+    def test_solve_digit_matrix(self):
+        banks = d.load_data(test=True)
+        assert d.solve_digit_matrix(d.load_digit_matrix(banks), 2) == 357
+
+    def test_matches_single_battery(self):
+        rng = random.Random(11)
+        banks = ["".join(rng.choice("0123456789") for _ in range(60)) for _ in range(200)]
+        for k in (1, 2, 12, 25, 60):
+            expected = sum(d.solve_battery(bank, k) for bank in banks)
+            assert d.solve_digit_matrix(d.load_digit_matrix(banks), k) == expected
+
+    def test_ragged_bank_falls_back(self):
+        assert d.solve_battery_bank(["987", "1219"], 2) == 98 + 29
+
+
+class TestBankIndex:
+    def test_leftmost_max(self):
+        index = d.BankIndex(["3193919", "1111111"])
+        starts, ends = np.array([0, 3]), np.array([6, 6])
+        assert index.leftmost_max(starts, ends).tolist() == [2, 3]
+        assert index.leftmost_max(np.array([3, 0]), np.array([6, 1])).tolist() == [4, 0]
+        assert index.leftmost_max(np.array([5, 5]), np.array([5, 5])).tolist() == [5, 5]
+
+    def test_select(self):
+        index = d.BankIndex(["234234234234278"])
+        assert index.total(2) == 78
+        assert index.total(12) == 434234234278
+
+    def test_narrow_table(self):
+        assert d.BankIndex(["12" * 50] * 3).table.dtype == np.uint8
+        assert d.BankIndex(["1" * 300]).table.dtype == np.uint16
+
+    def test_matches_select_peak_digits(self):
+        rng = random.Random(13)
+        for width in (1, 7, 70):
+            banks = ["".join(rng.choice("0123456789") for _ in range(width)) for _ in range(50)]
+            index = d.BankIndex(banks)
+            for k in range(1, width + 1, 3):
+                selected = ["".join(map(str, row)) for row in index.select(k).tolist()]
+                assert selected == [d.select_peak_digits(bank, k) for bank in banks]
+                assert index.total(k) == d.solve_battery_bank(banks, k)
+
+    def test_ragged_bank(self):
+        rng = random.Random(14)
+        banks = [
+            "".join(rng.choice("0123456789") for _ in range(rng.randint(12, 70)))
+            for _ in range(100)
+        ]
+        for k in (1, 2, 12):
+            assert d.BankIndex(banks).total(k) == sum(d.solve_battery(b, k) for b in banks)
+
+    def test_invalid_bank(self):
+        with pytest.raises(ValueError):
+            d.BankIndex(["12a"])
+        with pytest.raises(ValueError):
+            d.BankIndex(["12", ""])
+        with pytest.raises(ValueError):
+            d.BankIndex(["12", "345"]).total(3)
+
+    def test_index_shared_between_queries(self):
+        assert d.load_bank_index(test=True) is d.load_bank_index(test=True)
+        assert d.load_bank_index(test=True).total(2) == 357
+
+    def test_indexed_entry_point(self):
+        assert d.solve_day_three(2, test=True, indexed=True) == 357
+        assert d.solve_day_three(12, test=True, indexed=True) == 3121910778619
+
+    def test_cache_is_bounded(self):
+        assert d.index_bank.cache_info().maxsize == d.BANK_CACHE_SIZE
+
+    def test_rewrite_with_same_mtime_is_reparsed(self, tmp_path, monkeypatch):
+        path = tmp_path / "day_3.txt"
+        monkeypatch.setattr(d, "get_data_path", lambda test=False, raw_dir=None: path)
+        path.write_text("811111111111119\n")
+        stat = path.stat()
+        assert d.load_bank_index().total(2) == 89
+
+        path.write_text("234234234234278\n")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert d.load_bank_index().total(2) == 78
@@ -36,3 +36,215 @@ class TestFull:
     def test_full_demo_part_two(self):
         x = d.day_four_part_two(test=True)
         assert x == 43
+
+
+class TestCountRemovableRolls:
+    def test_demo_data(self):
+        x = d.load_array(test=True)
+        assert d.count_removable_rolls(x, threshold=4) == 43
+
+    def test_isolated_roll(self):
+        x = np.array([[0, 0, 0], [0, 1, 0], [0, 0, 0]])
+        assert d.count_removable_rolls(x, threshold=4) == 1
+
+    def test_nothing_removable(self):
+        x = np.ones((3, 3), dtype=int)
+        assert d.count_removable_rolls(x, threshold=0) == 0
+
+    def test_matches_round_by_round(self):
+        rng = np.random.default_rng(4)
+        for density in (0.3, 0.6, 0.8):
+            x = (rng.random((40, 55)) < density).astype(int)
+            for threshold in (3, 4, 5):
+                expected = d.remove_rolls_by_round(x, threshold)
+                assert d.count_removable_rolls(x, threshold) == expected
+
+    def test_small_frontier_batches(self, monkeypatch):
+        monkeypatch.setattr(d, "FRONTIER_BATCH_SIZE", 3)
+        x = (np.random.default_rng(5).random((40, 55)) < 0.7).astype(int)
+        assert d.count_removable_rolls(x, 4) == d.remove_rolls_by_round(x, 4)
+
+
+class TestNeighbourCounts:
+    def test_matches_sum_adjacent_2d(self):
+        rng = np.random.default_rng(12)
+        x = (rng.random((31, 17)) < 0.5).astype(np.uint8)
+        out = d.neighbour_counts(x)
+        assert out.dtype == np.uint8
+        assert np.array_equal(out, d.sum_adjacent_2d(x))
+
+    def test_reuses_buffer(self):
+        x = np.ones((3, 3), dtype=bool)
+        buffer = np.full((3, 3), 7, dtype=np.uint8)
+        out = d.neighbour_counts(x, out=buffer)
+        assert out is buffer
+        assert out.tolist() == [[3, 5, 3], [5, 8, 5], [3, 5, 3]]
+
+    def test_get_removable_mask(self):
+        grid = np.array([[1, 0], [1, 1]], dtype=bool)
+        counts = np.array([[2, 3], [5, 2]], dtype=np.uint8)
+        out = d.get_removable_mask(grid, counts, threshold=4)
+        assert out.dtype == bool
+        assert out.tolist() == [[True, False], [False, True]]
+
+    def test_remove_accessible_rolls_in_place(self):
+        grid = np.ones((3, 3), dtype=bool)
+        assert d.remove_accessible_rolls(grid, threshold=4) == 4
+        assert grid.tolist() == [[False, True, False], [True, True, True], [False, True, False]]
+
+    def test_round_by_round_matches_demo(self):
+        assert d.remove_rolls_by_round(d.load_array(test=True), threshold=4) == 43
+
+
+class TestPackedGrid:
+    def test_pack_round_trip(self):
+        rng = np.random.default_rng(21)
+        x = rng.random((9, 130)) < 0.5
+        words = d.pack_grid(x)
+        assert words.shape == (9, 3)
+        assert np.array_equal(d.unpack_grid(words, 130), x)
+
+    def test_neighbour_count_planes(self):
+        rng = np.random.default_rng(22)
+        x = (rng.random((20, 150)) < 0.6).astype(np.uint8)
+        planes = d.packed_neighbour_count_planes(d.pack_grid(x))
+        counts = sum(
+            (d.unpack_grid(plane, 150).astype(int) << bit) for bit, plane in enumerate(planes)
+        )
+        assert np.array_equal(counts, d.neighbour_counts(x))
+
+    def test_less_than_matches_dense(self):
+        rng = np.random.default_rng(23)
+        x = (rng.random((12, 70)) < 0.7).astype(np.uint8)
+        planes = d.packed_neighbour_count_planes(d.pack_grid(x))
+        for threshold in range(-1, 11):
+            out = d.unpack_grid(d.packed_less_than(planes, threshold), 70)
+            assert np.array_equal(out, d.neighbour_counts(x) < threshold)
+
+    def test_round_by_round_matches_dense(self):
+        rng = np.random.default_rng(24)
+        for density in (0.4, 0.7):
+            x = (rng.random((33, 200)) < density).astype(np.uint8)
+            expected = d.remove_rolls_by_round(x, threshold=4)
+            assert d.remove_rolls_by_round_packed(d.pack_grid(x), threshold=4) == expected
+
+    def test_engines(self):
+        assert d.day_four_part_one(test=True, engine="packed") == 13
+        assert d.day_four_part_two(test=True, engine="packed") == 43
+        assert d.day_four_part_two(test=True, engine="round") == 43
+
+    def test_unknown_engine(self):
+        with pytest.raises(ValueError):
+            d.day_four_part_one(test=True, engine="abacus")
+        with pytest.raises(ValueError):
+            d.day_four_part_two(test=True, engine="abacus")
+
+
+class TestTiled:
+    def test_split_row_bands(self):
+        assert d.split_row_bands(10, 3) == [(0, 3), (3, 6), (6, 10)]
+        assert d.split_row_bands(2, 4) == [(0, 1), (1, 2)]
+
+    def test_matches_serial(self):
+        rng = np.random.default_rng(31)
+        for shape in ((1, 40), (7, 7), (57, 43)):
+            x = (rng.random(shape) < 0.65).astype(np.uint8)
+            expected = d.remove_rolls_by_round(x, threshold=4)
+            for n_workers in (1, 2, 5):
+                assert (
+                    d.remove_rolls_by_round_tiled(x, threshold=4, n_workers=n_workers) == expected
+                )
+
+    def test_single_round(self):
+        x = d.load_array(test=True)
+        assert d.remove_rolls_by_round_tiled(x, threshold=4, max_rounds=1, n_workers=3) == 13
+
+    def test_engines(self):
+        assert d.day_four_part_one(test=True, engine="tiled") == 13
+        assert d.day_four_part_two(test=True, engine="tiled") == 43
+
+
+class TestLoadGridMmap:
+    def write(self, tmp_path, content):
+        path = tmp_path / "grid.txt"
+        path.write_bytes(content)
+        return path
+
+    def test_matches_line_loader(self):
+        path = d.get_data_path(test=True)
+        out = d.load_grid_mmap(path)
+        assert out.dtype == np.uint8
+        assert np.array_equal(out, d.load_array_lines(path))
+
+    def test_no_trailing_newline(self, tmp_path):
+        path = self.write(tmp_path, b"@.@\n.@.")
+        assert d.load_grid_mmap(path).tolist() == [[1, 0, 1], [0, 1, 0]]
+
+    def test_windows_line_endings(self, tmp_path):
+        path = self.write(tmp_path, b"@.\r\n.@\r\n")
+        assert d.load_grid_mmap(path).tolist() == [[1, 0], [0, 1]]
+
+    def test_single_line(self, tmp_path):
+        path = self.write(tmp_path, b"@@.\n\n")
+        assert d.load_grid_mmap(path).tolist() == [[1, 1, 0]]
+
+    def test_blank_line_falls_back(self, tmp_path):
+        path = self.write(tmp_path, b"@.\n\n.@\n")
+        assert d.load_grid_mmap(path).tolist() == [[1, 0], [0, 1]]
+
+    def test_empty_file(self, tmp_path):
+        path = self.write(tmp_path, b"")
+        assert d.load_grid_mmap(path).shape == (0, 0)
+
+    def test_unexpected_character(self, tmp_path):
+        path = self.write(tmp_path, b"@.\n.#\n")
+        with pytest.raises(ValueError, match="Unexpected character '#'"):
+            d.load_grid_mmap(path)
+
+    def test_unexpected_character_last_line(self, tmp_path):
+        path = self.write(tmp_path, b"@.\n.x")
+        with pytest.raises(ValueError, match="Unexpected character 'x'"):
+            d.load_grid_mmap(path)
+
+
+class TestLoadPackedGrid:
+    def write(self, tmp_path, content):
+        path = tmp_path / "grid.txt"
+        path.write_bytes(content)
+        return path
+
+    def test_matches_pack_grid(self, tmp_path, monkeypatch):
+        rng = np.random.default_rng(41)
+        rows = np.where(rng.random((23, 130)) < 0.6, ord("@"), ord("."))
+        path = self.write(tmp_path, b"\n".join(bytes(row.tolist()) for row in rows) + b"\n")
+        expected = d.pack_grid(d.load_grid_mmap(path))
+        monkeypatch.setattr(d, "PACK_CHUNK_CELLS", 300)
+        assert np.array_equal(d.load_packed_grid(path), expected)
+
+    def test_windows_line_endings(self, tmp_path):
+        path = self.write(tmp_path, b"@.\r\n.@")
+        assert d.unpack_grid(d.load_packed_grid(path), 2).tolist() == [[1, 0], [0, 1]]
+
+    def test_whitespace_falls_back(self, tmp_path):
+        path = self.write(tmp_path, b"@. \n.@ \n")
+        assert d.unpack_grid(d.load_packed_grid(path), 2).tolist() == [[1, 0], [0, 1]]
+
+    def test_empty_file(self, tmp_path):
+        assert d.load_packed_grid(self.write(tmp_path, b"")).shape == (0, 0)
+
+    def test_unexpected_character(self, tmp_path):
+        path = self.write(tmp_path, b"@.\n.#\n")
+        with pytest.raises(ValueError, match="Unexpected character '#'"):
+            d.load_packed_grid(path)
+
+    def test_buffers_reused_between_rounds(self):
+        rng = np.random.default_rng(42)
+        words = d.pack_grid(rng.random((17, 90)) < 0.7)
+        buffers = d.PackedBuffers.for_words(words)
+        planes = d.packed_neighbour_count_planes(words, buffers)
+        assert planes is buffers.planes
+        expected = d.remove_rolls_by_round(d.unpack_grid(words, 90), threshold=4)
+        removed = 0
+        while n := d.remove_accessible_rolls_packed(words, 4, buffers):
+            removed += n
+        assert removed == expected
@@ -69,3 +69,180 @@ class TestCheckEndToEnd:
     def test_check_end_to_end_part_two(self):
         _, output = d.day_five(True)
         assert output == 14
+
+
+class TestIntervalIndex:
+    def test_build_interval_index(self):
+        starts, ends = d.build_interval_index([[10, 14], [3, 5], [12, 18], [16, 20]])
+        assert starts.tolist() == [3, 10]
+        assert ends.tolist() == [5, 20]
+
+    def test_is_ingredient_fresh(self):
+        starts, ends = d.build_interval_index([[3, 5], [10, 14]])
+        out = [d.is_ingredient_fresh(x, starts, ends) for x in (2, 3, 5, 6, 14, 15)]
+        assert out == [False, True, True, False, True, False]
+
+    def test_classify_ingredients(self):
+        starts, ends = d.build_interval_index([[3, 5], [10, 14]])
+        out = d.classify_ingredients(np.array([1, 3, 7, 10, 14, 99]), starts, ends)
+        assert out.tolist() == [False, True, False, True, True, False]
+
+    def test_classify_without_ranges(self):
+        starts, ends = d.build_interval_index([])
+        assert d.classify_ingredients(np.array([1, 2]), starts, ends).tolist() == [False, False]
+
+    def test_matches_linear_scan(self):
+        rng = np.random.default_rng(5)
+        lower = rng.integers(0, 1000, size=50)
+        ranges = [[int(a), int(a + b)] for a, b in zip(lower, rng.integers(0, 30, size=50))]
+        ingredients = rng.integers(0, 1100, size=2000).tolist()
+        expected = sum(d.is_ingredient_valid(x, ranges) for x in ingredients)
+        assert d.get_sum_valid_ingredients(ingredients, ranges) == expected
+
+
+class TestMergeRangesArray:
+    def test_parse_ranges_array(self):
+        starts, ends = d.parse_ranges_array(["3-5", "10-14"])
+        assert (starts.tolist(), ends.tolist()) == ([3, 10], [5, 14])
+
+    def test_parse_ranges_array_invalid(self):
+        with pytest.raises(ValueError):
+            d.parse_ranges_array(["3-5", "10"])
+
+    @pytest.mark.parametrize("line", ["1-2-3", "4", "-4", "4-", "1 2-3", "a-5"])
+    def test_parse_ranges_array_malformed_line(self, line):
+        with pytest.raises(ValueError):
+            d.parse_ranges_array([line, "4-6"])
+
+    def test_parse_ranges_array_reversed(self):
+        with pytest.raises(ValueError, match="'9-3'"):
+            d.parse_ranges_array(["3-5", "9-3"])
+
+    @pytest.mark.parametrize(
+        "function",
+        [d.build_interval_index, d.get_total_numbers_in_range],
+    )
+    def test_reversed_range_rejected(self, function):
+        with pytest.raises(ValueError, match="5-3"):
+            function([[5, 3], [1, 10]])
+
+    def test_parse_ranges_array_whitespace(self):
+        starts, ends = d.parse_ranges_array([" 3-5\n", "10-14 "])
+        assert (starts.tolist(), ends.tolist()) == ([3, 10], [5, 14])
+
+    def test_merge_ranges_array(self):
+        starts, ends = d.merge_ranges_array(np.array([1, 2, 8]), np.array([3, 4, 10]))
+        assert (starts.tolist(), ends.tolist()) == ([1, 8], [4, 10])
+
+    def test_nested_ranges(self):
+        starts, ends = d.merge_ranges_array(np.array([1, 2, 12]), np.array([20, 4, 15]))
+        assert (starts.tolist(), ends.tolist()) == ([1], [20])
+
+    def test_empty(self):
+        starts, ends = d.merge_ranges_array(np.array([]), np.array([]))
+        assert starts.size == ends.size == 0
+        assert d.get_total_numbers_in_range([]) == 0
+
+    def test_matches_simplify_ranges(self):
+        rng = np.random.default_rng(18)
+        for _ in range(20):
+            starts = rng.integers(0, 500, size=60)
+            ends = starts + rng.integers(0, 40, size=60)
+            pairs = [[int(a), int(b)] for a, b in zip(starts, ends)]
+            merged_starts, merged_ends = d.merge_ranges_array(starts, ends)
+            expected = d.simplify_ranges(pairs)
+            assert [list(p) for p in zip(merged_starts.tolist(), merged_ends.tolist())] == expected
+            assert d.count_range_total(starts, ends) == sum(b - a + 1 for a, b in expected)
+
+
+class TestStreaming:
+    def write(self, tmp_path, content):
+        path = tmp_path / "input.txt"
+        path.write_text(content)
+        return path
+
+    def test_read_range_section(self, tmp_path):
+        path = self.write(tmp_path, "3-5\n10-14\n\n1\n5\n")
+        with path.open() as f:
+            starts, ends = d.read_range_section(f)
+            assert (starts.tolist(), ends.tolist()) == ([3, 10], [5, 14])
+            assert f.readline() == "1\n"
+
+    def test_iter_ingredient_batches(self, tmp_path):
+        path = self.write(tmp_path, "1\n5\n8\n\n11\n17\n")
+        with path.open() as f:
+            batches = [batch.tolist() for batch in d.iter_ingredient_batches(f, batch_size=2)]
+        assert batches == [[1, 5], [8], [11, 17]]
+
+    def test_matches_loaded_path(self):
+        ranges, ingredients = d.load_data(test=True)
+        valid_ingredients = d.get_fresh_ingredient_ranges(ranges)
+        expected = (
+            d.get_sum_valid_ingredients(ingredients, valid_ingredients),
+            d.get_total_numbers_in_range(valid_ingredients),
+        )
+        assert d.count_fresh_streaming(d.get_data_path(test=True), batch_size=2) == expected
+
+    def test_no_ingredients(self, tmp_path):
+        path = self.write(tmp_path, "3-5\n4-8\n")
+        assert d.count_fresh_streaming(path) == (0, 6)
+
+    def test_bad_ingredient(self, tmp_path):
+        path = self.write(tmp_path, "3-5\n\n4\n4 5\n")
+        with pytest.raises(ValueError):
+            d.count_fresh_streaming(path)
+
+
+class TestRangeIndex:
+    def write(self, tmp_path, content):
+        path = tmp_path / "input.txt"
+        path.write_bytes(content)
+        return path
+
+    def test_parse_range_index(self, tmp_path):
+        path = self.write(tmp_path, b"3-5\n10-14\n4-6\n\n1\n5\n")
+        merged_starts, merged_ends, (n_ranges, offset) = d.parse_range_index(path)
+        assert (merged_starts.tolist(), merged_ends.tolist()) == ([3, 10], [6, 14])
+        assert (n_ranges, offset) == (3, 15)
+
+    def test_matches_streaming(self, tmp_path):
+        path = self.write(tmp_path, b"3-5\r\n10-14\r\n\r\n1\r\n5\r\n12\r\n20")
+        index = d.parse_range_index(path)
+        result = (d.count_fresh_indexed(path, index, batch_size=2), d.count_range_index(index))
+        assert result == d.count_fresh_streaming(path) == (2, 8)
+
+    def test_no_ingredients(self, tmp_path):
+        path = self.write(tmp_path, b"3-5\n4-8\n")
+        index = d.parse_range_index(path)
+        assert (d.count_fresh_indexed(path, index), d.count_range_index(index)) == (0, 6)
+
+    def test_day_five(self):
+        assert d.day_five(test=True) == d.count_fresh_streaming(d.get_data_path(test=True))
+
+
+class TestFreshSet:
+    def test_matches_list_solution(self):
+        ranges, ingredients = d.load_data(test=True)
+        fresh = d.load_fresh_set(test=True)
+        valid_ranges = d.get_fresh_ingredient_ranges(ranges)
+        assert fresh.total == d.get_total_numbers_in_range(valid_ranges)
+        for ingredient in ingredients:
+            expected = d.is_ingredient_valid(ingredient, valid_ranges)
+            assert fresh.contains(int(ingredient)) == expected
+
+    def test_ranges_arriving_later(self):
+        ranges, _ = d.load_data(test=True)
+        fresh = d.build_fresh_set(ranges[:2])
+        d.add_fresh_ranges(fresh, ranges[2:])
+        assert list(fresh) == list(d.build_fresh_set(ranges))
+
+        d.add_fresh_ranges(fresh, ["21-30", " 40-41 "])
+        expected = d.get_total_numbers_in_range(
+            d.get_fresh_ingredient_ranges(ranges + ["21-30", "40-41"])
+        )
+        assert fresh.total == expected
+
+    @pytest.mark.parametrize("line", ["9-3", "1-2-3", "a-5"])
+    def test_bad_arrival(self, line):
+        with pytest.raises(ValueError):
+            d.add_fresh_ranges(d.build_fresh_set(["3-5"]), [line])
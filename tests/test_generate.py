@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from advent_2025.solutions import day1, day2, day3, day4, day5
+from advent_2025.utils import generate
+
+
+class TestDeterminism:
+    @pytest.mark.parametrize("day", range(1, 6))
+    def test_same_seed_same_file(self, tmp_path, day):
+        first = generate.write_puzzle_input(day, tmp_path / "a.txt", 50, seed=3)
+        second = generate.write_puzzle_input(day, tmp_path / "b.txt", 50, seed=3)
+        assert first.read_bytes() == second.read_bytes()
+
+    def test_different_seed_different_file(self, tmp_path):
+        first = generate.write_grid(tmp_path / "a.txt", 20, 20, seed=1)
+        second = generate.write_grid(tmp_path / "b.txt", 20, 20, seed=2)
+        assert first.read_bytes() != second.read_bytes()
+
+    def test_unknown_day(self, tmp_path):
+        with pytest.raises(ValueError):
+            generate.write_puzzle_input(6, tmp_path / "a.txt", 10)
+
+
+class TestFormats:
+    def test_rotation_log(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(generate, "CHUNK_LINES", 7)
+        path = generate.write_rotation_log(tmp_path / "day1.txt", 100, max_distance=50)
+        moves = day1.parse_directions_bytes(path.read_bytes())
+        assert moves.size == 100
+        assert np.abs(moves).max() <= 50
+        assert day1.solve_stream(path, 2).n_zeroes == day1.count_zeroes(moves, 50, 2)[0]
+
+    def test_id_ranges(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(generate, "CHUNK_LINES", 7)
+        path = generate.write_id_ranges(tmp_path / "day2.txt", 30, max_digits=6, overlap=0.5)
+        codes = path.read_text().split(",")
+        assert len(codes) == 30
+        bounds = [tuple(int(x) for x in code.split("-")) for code in codes]
+        assert all(start <= end for start, end in bounds)
+        assert all(len(str(start)) <= 7 for start, _ in bounds)
+        day2.count_and_sum_invalid_ids_in_ranges(codes, 2)
+
+    def test_battery_banks(self, tmp_path):
+        path = generate.write_battery_banks(tmp_path / "day3.txt", 40, width=15)
+        banks = path.read_text().split()
+        assert len(banks) == 40
+        assert {len(bank) for bank in banks} == {15}
+        assert "0" not in "".join(banks)
+        assert day3.solve_battery_bank(banks, 12) > 0
+
+    @pytest.mark.parametrize("density", [0.0, 0.5, 1.0])
+    def test_grid_density(self, tmp_path, density):
+        path = generate.write_grid(tmp_path / "day4.txt", 60, 40, density=density)
+        grid = day4.load_grid_mmap(path)
+        assert grid.shape == (60, 40)
+        assert grid.mean() == pytest.approx(density, abs=0.05)
+
+    def test_ingredient_file(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(generate, "CHUNK_LINES", 7)
+        path = generate.write_ingredient_file(
+            tmp_path / "day5.txt", 20, 500, max_id=10_000, max_width=100, fresh_fraction=1.0
+        )
+        ranges, ingredients = day5.load_split_file(path)
+        assert len(ranges) == 20
+        assert len(ingredients) == 500
+        starts, ends = day5.parse_ranges_array(ranges)
+        fresh = day5.classify_ingredients(
+            np.array([int(i) for i in ingredients]), *day5.merge_ranges_array(starts, ends)
+        )
+        assert fresh.all()
+
+    def test_ingredient_overlap(self, tmp_path):
+        path = generate.write_ingredient_file(
+            tmp_path / "day5.txt", 50, 0, max_id=10**9, max_width=1000, overlap=1.0
+        )
+        ranges, _ = day5.load_split_file(path)
+        starts, ends = day5.parse_ranges_array(ranges)
+        assert len(day5.merge_ranges_array(starts, ends)[0]) == 1
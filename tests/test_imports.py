@@ -0,0 +1,48 @@
+import os
+import pytest
+import subprocess
+import sys
+
+# Cumulative `python -X importtime` budget per solution module, in microseconds.
+# Loguru and NumPy alone take ~200ms; pulling pandas back in roughly doubles it.
+IMPORT_BUDGET_US = int(os.environ.get("ADVENT_IMPORT_BUDGET_US", 500_000))
+
+SOLUTION_MODULES = [f"advent_2025.solutions.day{day}" for day in range(1, 6)]
+
+# Libraries a module must not pull in at import time
+UNUSED_LIBRARIES = {
+    "advent_2025.solutions.day1": ["pandas", "tqdm"],
+    "advent_2025.solutions.day2": ["pandas", "tqdm", "numpy", "pebble"],
+    "advent_2025.solutions.day3": ["pandas", "tqdm"],
+    "advent_2025.solutions.day4": ["pandas", "tqdm"],
+    "advent_2025.solutions.day5": ["pandas", "tqdm"],
+}
+
+
+def get_import_times(module: str) -> dict[str, int]:
+    """Import `module` in a fresh interpreter and return the cumulative time (us) of each import."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize("module", SOLUTION_MODULES)
+def test_import_time_within_budget(module):
+    times = get_import_times(module)
+    assert times[module] < IMPORT_BUDGET_US
+
+
+@pytest.mark.parametrize("module", SOLUTION_MODULES)
+def test_unused_libraries_not_imported(module):
+    times = get_import_times(module)
+    assert not [library for library in UNUSED_LIBRARIES[module] if library in times]
@@ -0,0 +1,111 @@
+import json
+
+import pytest
+
+from advent_2025.solutions import day1, day2, day3, day4, day5
+from advent_2025.utils import instrumentation
+from advent_2025.utils.instrumentation import Instrumentation
+
+
+@pytest.fixture
+def enabled():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield instrumentation.INSTRUMENTATION
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+class TestInstrumentation:
+    def test_disabled_records_nothing(self):
+        x = Instrumentation()
+        with x.stage("day1.solve"):
+            x.count("day1.lines_parsed", 10)
+        assert x.snapshot() == {"stages": {}, "counters": {}}
+
+    def test_enabled_accumulates(self):
+        x = Instrumentation(enabled=True)
+        for _ in range(3):
+            with x.stage("day1.solve"):
+                x.count("day1.lines_parsed", 10)
+        snapshot = x.snapshot()
+        assert snapshot["counters"] == {"day1.lines_parsed": 30}
+        assert snapshot["stages"]["day1.solve"]["calls"] == 3
+        assert snapshot["stages"]["day1.solve"]["seconds"] >= 0
+
+    def test_stage_records_on_exception(self):
+        x = Instrumentation(enabled=True)
+        with pytest.raises(KeyError):
+            with x.stage("day1.parse"):
+                raise KeyError
+        assert x.calls == {"day1.parse": 1}
+
+    def test_json_export(self, tmp_path):
+        x = Instrumentation(enabled=True)
+        x.count("day4.rounds", 2)
+        path = tmp_path / "metrics.json"
+        text = x.to_json(path)
+        assert json.loads(path.read_text()) == json.loads(text)
+        assert json.loads(text)["counters"] == {"day4.rounds": 2}
+
+    def test_reset(self):
+        x = Instrumentation(enabled=True)
+        x.count("day4.rounds")
+        x.reset()
+        assert x.snapshot() == {"stages": {}, "counters": {}}
+
+
+class TestSolverInstrumentation:
+    def test_day_one(self, enabled):
+        assert day1.day_one(2, test=True) == 6
+        snapshot = enabled.snapshot()
+        assert {"day1.read", "day1.solve"} <= set(snapshot["stages"])
+        assert snapshot["counters"]["day1.lines_parsed"] == 10
+
+    def test_day_one_loop_aggregates(self, enabled):
+        assert day1.calculate_solution([-68, -30, 48, -5, 60, -55, -1, -99, 14, -82], 50, 2) == 6
+        assert enabled.counters == {"day1.codes_processed": 10, "day1.full_turns": 0}
+
+    @pytest.mark.parametrize("engine", ["worklist", "round", "tiled", "packed"])
+    def test_day_four(self, enabled, engine):
+        assert day4.day_four_part_two(test=True, engine=engine) == 43
+        assert enabled.counters["day4.cells_removed"] == 43
+        assert enabled.counters["day4.cells_parsed"] == 100
+        if engine != "worklist":
+            assert enabled.counters["day4.rounds"] == 9
+
+    def test_day_five(self, enabled):
+        # The second run is always a cache hit, and still reports what was parsed
+        for run in range(2):
+            instrumentation.reset()
+            assert day5.day_five(test=True) == (3, 14)
+            assert enabled.counters["day5.ranges_parsed"] == 4
+            assert enabled.counters["day5.ranges_merged"] == 2
+            assert enabled.counters["day5.ingredients_parsed"] == 6
+            assert {"day5.read", "day5.parse", "day5.solve"} <= set(enabled.calls)
+        assert enabled.counters["data.cache_hits"] == 1
+
+    @pytest.mark.parametrize(
+        "day, solve",
+        [
+            (1, lambda: day1.day_one(2, test=True)),
+            (2, lambda: day2.solve_day_two(2, test=True)),
+            (3, lambda: day3.solve_day_three(12, test=True)),
+            (4, lambda: day4.day_four_part_one(test=True)),
+            (4, lambda: day4.day_four_part_two(test=True, engine="packed")),
+            (5, lambda: day5.day_five(test=True)),
+        ],
+    )
+    def test_stage_names(self, enabled, day, solve):
+        solve()
+        assert set(enabled.calls) <= {f"day{day}.{name}" for name in ("read", "parse", "solve")}
+        assert f"day{day}.solve" in enabled.calls
+
+    def test_day_five_streaming(self, enabled):
+        assert day5.count_fresh_streaming(day5.get_data_path(test=True)) == (3, 14)
+        assert enabled.counters == {
+            "day5.ranges_parsed": 4,
+            "day5.ranges_merged": 2,
+            "day5.ingredients_parsed": 6,
+        }
+        assert set(enabled.calls) == {"day5.parse", "day5.solve"}
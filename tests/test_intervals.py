@@ -0,0 +1,82 @@
+import pytest
+import random
+
+from advent_2025.utils.intervals import IntervalSet
+
+
+class TestAddRange:
+    def test_disjoint(self):
+        x = IntervalSet()
+        x.add_range(10, 14)
+        x.add_range(3, 5)
+        assert list(x) == [(3, 5), (10, 14)]
+        assert x.total == 8
+
+    def test_overlapping(self):
+        x = IntervalSet.from_ranges([[3, 5], [10, 14], [16, 20], [12, 18]])
+        assert list(x) == [(3, 5), (10, 20)]
+        assert x.total == 14
+
+    def test_adjacent_ranges_merge(self):
+        x = IntervalSet.from_ranges([[1, 3], [4, 6]])
+        assert list(x) == [(1, 6)]
+
+    def test_covering_range(self):
+        x = IntervalSet.from_ranges([[2, 3], [5, 6], [9, 9]])
+        x.add_range(1, 10)
+        assert list(x) == [(1, 10)]
+        assert x.total == 10
+
+    def test_invalid_range(self):
+        with pytest.raises(ValueError):
+            IntervalSet().add_range(5, 4)
+
+
+class TestRemoveRange:
+    def test_split(self):
+        x = IntervalSet.from_ranges([[1, 10]])
+        x.remove_range(4, 6)
+        assert list(x) == [(1, 3), (7, 10)]
+        assert x.total == 7
+
+    def test_across_ranges(self):
+        x = IntervalSet.from_ranges([[1, 5], [8, 10], [12, 20]])
+        x.remove_range(3, 15)
+        assert list(x) == [(1, 2), (16, 20)]
+        assert x.total == 7
+
+    def test_missing_range(self):
+        x = IntervalSet.from_ranges([[1, 5]])
+        x.remove_range(7, 9)
+        assert list(x) == [(1, 5)]
+
+
+class TestContains:
+    def test_contains(self):
+        x = IntervalSet.from_ranges([[3, 5], [10, 14]])
+        assert [v in x for v in (2, 3, 5, 6, 14, 15)] == [False, True, True, False, True, False]
+
+    def test_empty(self):
+        assert not IntervalSet().contains(0)
+        assert len(IntervalSet()) == 0
+
+
+class TestAgainstPythonSet:
+    def test_random_updates(self):
+        rng = random.Random(17)
+        x = IntervalSet()
+        expected = set()
+        for _ in range(500):
+            start = rng.randint(0, 300)
+            end = start + rng.randint(0, 25)
+            if rng.random() < 0.7:
+                x.add_range(start, end)
+                expected.update(range(start, end + 1))
+            else:
+                x.remove_range(start, end)
+                expected.difference_update(range(start, end + 1))
+            assert x.total == len(expected)
+
+        assert {v for v in range(-5, 340) if v in x} == expected
+        intervals = list(x)
+        assert all(a[1] + 1 < b[0] for a, b in zip(intervals, intervals[1:]))
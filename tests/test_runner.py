@@ -0,0 +1,72 @@
+import json
+
+from advent_2025 import runner
+from advent_2025.utils import data
+
+EXPECTED_TEST_ANSWERS = {
+    (1, 1): 3,
+    (1, 2): 6,
+    (2, 1): 1227775554,
+    (2, 2): 4174379265,
+    (3, 1): 357,
+    (3, 2): 3121910778619,
+    (4, 1): 13,
+    (4, 2): 43,
+    (5, 1): 3,
+    (5, 2): 14,
+}
+
+
+class TestPlanJobs:
+    def test_skips_missing_inputs(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(data, "RAW_DATA_DIR", tmp_path)
+        (tmp_path / "test_day_1.txt").write_text("R5\n")
+        (tmp_path / "day_2.txt").write_text("11-22")
+        jobs, missing = runner.plan_jobs([1, 2], ["test", "real"])
+        assert jobs == [(1, "test"), (2, "real")]
+        assert missing == [tmp_path / "day_1.txt", tmp_path / "test_day_2.txt"]
+
+
+class TestRunDayInput:
+    def test_shares_load_between_parts(self):
+        results = runner.run_day_input(4, "test")
+        assert [(r.part, r.answer) for r in results] == [(1, 13), (2, 43)]
+        assert results[0].load_seconds == results[1].load_seconds
+
+    def test_part_error_is_recorded(self, monkeypatch):
+        def fail(grid):
+            raise ValueError("bad grid")
+
+        monkeypatch.setitem(runner.SOLVERS[4].parts, 2, fail)
+        results = runner.run_day_input(4, "test")
+        assert results[0].answer == 13
+        assert results[1].answer is None
+        assert results[1].error == "ValueError: bad grid"
+
+
+class TestRunJobs:
+    def test_all_days(self):
+        jobs = [(day, "test") for day in sorted(runner.SOLVERS)]
+        results = runner.run_jobs(jobs, max_workers=2)
+        assert {(r.day, r.part): r.answer for r in results} == EXPECTED_TEST_ANSWERS
+        assert not any(r.error for r in results)
+
+    def test_report(self):
+        results = runner.run_day_input(1, "test")
+        report = runner.format_report(results, wall_seconds=0.5)
+        assert report.splitlines()[1].split()[:4] == ["1", "1", "test", "3"]
+        assert report.splitlines()[-1].startswith("Wall clock: 0.5000s")
+
+
+class TestMain:
+    def test_json(self, tmp_path, capsys):
+        path = tmp_path / "timings.json"
+        assert runner.main(["--days", "3", "--inputs", "test", "--json", str(path)]) == 0
+        records = json.loads(path.read_text())["jobs"]
+        assert [(r["part"], r["answer"]) for r in records] == [(1, 357), (2, 3121910778619)]
+        assert "Wall clock" in capsys.readouterr().out
+
+    def test_nothing_to_run(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.setattr(data, "RAW_DATA_DIR", tmp_path)
+        assert runner.main(["--days", "1"]) == 0
+        assert "Skipping missing input" in capsys.readouterr().out